@@ -7,34 +7,78 @@ class Button():
         self.font = font
         self.base_color, self.hovering_color = base_color, hovering_color
         self.text_input = text_input
-        self.text = self.font.render(self.text_input, True, self.base_color)
+
+        # Both label states are rendered once, changeColor only swaps between them
+        self.base_text = self.font.render(self.text_input, True, self.base_color)
+        self.hover_text = self.base_text if self.hovering_color == self.base_color else self.font.render(self.text_input, True, self.hovering_color)
+        self.text = self.base_text
+        self.hovered = False
+        self.text_only = self.image is None
 
         if self.image is None:
             self.image = self.text
-        
+
         elif self.text_input is None:
             self.text = self.image
 
         self.rect = self.image.get_rect(center=(self.x_coordinate, self.y_coordinate))
         self.text_rect = self.text.get_rect(center=(self.x_coordinate, self.y_coordinate))
+        self.dirty_rect = self.rect.union(self.text_rect)
 
     def update(self, screen):
-        
-        if self.image is not None:
+
+        if not self.text_only:
             screen.blit(self.image, self.rect)
-        
-        screen.blit(self.text, self.text_rect)
-    
+
+        if self.text is not self.image or self.text_only:
+            screen.blit(self.text, self.text_rect)
+
     def checkForInput(self, position):
 
-        if position[0] in range(self.rect.left, self.rect.right) and position[1] in range(self.rect.top, self.rect.bottom):
-            return True
-        return False
-    
+        return self.rect.collidepoint(position)
+
     def changeColor(self, position):
+        """Switches between the pre-rendered base and hover labels. Returns True if the hover state changed."""
+
+        hovered = self.checkForInput(position)
+        if hovered == self.hovered:
+            return False
+
+        self.hovered = hovered
+        if self.text_input is not None:
+            self.text = self.hover_text if hovered else self.base_text
+        return True
+
+class ButtonGroup():
+
+    def __init__(self, buttons):
+        """
+        Buttons that are drawn together on one screen (a menu, or the level HUD).
+
+        Args:
+            buttons (list): Button objects, drawn in this order.
+        """
+        self.buttons = list(buttons)
+
+    def __iter__(self):
+        return iter(self.buttons)
+
+    def hover(self, position):
+        """
+        Updates the hover state of every button for the mouse position.
+        Returns the rects of the buttons that changed (empty if nothing needs to be redrawn).
+        """
+        return [button.dirty_rect for button in self.buttons if button.changeColor(position)]
+
+    def draw(self, screen):
+        """Blits every button and returns the rects they cover."""
+        for button in self.buttons:
+            button.update(screen)
+        return [button.dirty_rect for button in self.buttons]
 
-        if self.checkForInput(position):
-            self.text = self.font.render(self.text_input, True, self.hovering_color)
-        
-        else:
-            self.text = self.font.render(self.text_input, True, self.base_color)
\ No newline at end of file
+    def clicked(self, position):
+        """Returns the button under the position, or None."""
+        for button in self.buttons:
+            if button.checkForInput(position):
+                return button
+        return None
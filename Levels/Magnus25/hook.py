@@ -1,5 +1,6 @@
 import pygame
 import math
+from zoom_cache import zoomed
 
 class Hook:
     def __init__(self, x, y, length, swing_angle, speed, image=None):
@@ -66,11 +67,12 @@ class Hook:
         end_screen = camera.apply_point((end_x, end_y))
 
         # Draw the rope
-        pygame.draw.line(surface, (255, 255, 255), pivot_screen, end_screen, 2)
+        pygame.draw.line(surface, (255, 255, 255), pivot_screen, end_screen, max(1, round(2 * camera.zoom)))
 
         # Draw the hook
         if self.image:
-            hook_rect = self.image.get_rect(center=end_screen)
-            surface.blit(self.image, hook_rect)
+            hook_image = zoomed(self.image, camera.zoom)
+            hook_rect = hook_image.get_rect(center=end_screen)
+            surface.blit(hook_image, hook_rect)
         else:
-            pygame.draw.circle(surface, ("#17141a"), (int(end_screen[0]), int(end_screen[1])), 20)
+            pygame.draw.circle(surface, ("#17141a"), (int(end_screen[0]), int(end_screen[1])), max(1, round(20 * camera.zoom)))
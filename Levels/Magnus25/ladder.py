@@ -1,4 +1,6 @@
 import pygame
+from asset_cache import load_image
+from zoom_cache import zoomed
 
 class Ladder:
     def __init__(self, x, y, height):
@@ -15,8 +17,11 @@ class Ladder:
         self.y = y
         self.height = height
         self.width = 10  # Default width of the ladder
-        self.image = pygame.image.load("Levels/Magnus25/assets/ladder.png").convert_alpha()
-        self.image = pygame.transform.scale(self.image, (self.width, self.height))
+        self.image = None
+
+        # Headless simulations only need the rect, ladders of the same height share one image
+        if pygame.display.get_surface() is not None:
+            self.image = load_image("Levels/Magnus25/assets/ladder.png", (self.width, self.height))
         self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
         self.on_ladder = False
 
@@ -29,4 +34,4 @@ class Ladder:
         camera: The camera object that provides the apply method to adjust for the camera's position.
         """
         ladder_rect = camera.apply(self)
-        surface.blit(self.image, (ladder_rect.x, ladder_rect.y))
+        surface.blit(zoomed(self.image, camera.zoom), (ladder_rect.x, ladder_rect.y))
@@ -1,5 +1,6 @@
 import pygame
 import random
+from text_cache import render_text
 
 class Storm:
     def __init__(self, trigger_distance, platforms, font, screen_size):
@@ -9,7 +10,7 @@ class Storm:
         Parameters:
         trigger_distance (float): The distance from the platform to trigger the storm.
         platform (Platform): The platform to use as shelter.
-        font (pygame.font.Font): Font for displaying text.
+        font (pygame.font.Font): Unused, the warning is drawn through the shared text cache.
         screen_size (tuple): Size of the game screen (width, height).
         """
         self.trigger_distance = trigger_distance
@@ -17,7 +18,6 @@ class Storm:
         self.trigger_platform = None
         self.disarmed = False
         self.disarm_distance = 350
-        self.font = pygame.font.Font('fonts/pixelated.ttf', 50)
         self.screen_size = screen_size
         self.active = False
         self.warning = False
@@ -33,7 +33,7 @@ class Storm:
 
         Parameters:
         player (Player): The player object.
-        current_time (float): Current time in seconds.
+        current_time (float): Current game clock time in seconds (GameClock.now()).
         """
 
         if self.disarmed:
@@ -96,7 +96,7 @@ class Storm:
             surface.blit(overlay, (0, 0))
 
             # Display the warning message
-            warning_text = self.font.render("Stay on the shelter platform!", True, (255, 69, 0))
+            warning_text = render_text('fonts/pixelated.ttf', 50, "Stay on the shelter platform!", (255, 69, 0))
             surface.blit(
                 warning_text,
                 (self.screen_size[0] // 2 - warning_text.get_width() // 2, 50)
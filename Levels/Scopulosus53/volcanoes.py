@@ -1,39 +1,52 @@
 import pygame
 import random
-import time
-from sprites import Spritesheet
+from asset_cache import load_image, load_animation
+from game_clock import default_clock
+from zoom_cache import zoomed
 
 class Volcano:
-    def __init__(self, name, position, steam_height, steam_correction, screen, stretch_size=(1400, 500)):
+    def __init__(self, name, position, steam_height, steam_correction, screen, stretch_size=(1400, 500), clock=default_clock):
         """
         Initializes the Volcano.
 
         :param position: A tuple (x, y) representing the volcano's position.
         :param screen: The screen surface where the volcano will be drawn.
         :param stretch_size: A tuple (width, height) specifying the size to stretch the volcano image.
+        :param clock: GameClock the steam cycle and animations are timed with (pauses freeze it).
         """
         self.name = name
         self.position = position
         self.screen = screen
         self.stretch_size = stretch_size
+        self.clock = clock
+
+        headless = pygame.display.get_surface() is None  # Headless simulations only need the rects and timings
 
         # Load and stretch the volcano image
-        self.original_volcano_image = pygame.image.load("Levels/Scopulosus53/assets/volcano.png").convert_alpha()
-        self.volcano_image = pygame.transform.scale(self.original_volcano_image, (self.stretch_size))
+        if headless:
+            self.volcano_image = None
+            self.volcano_rect = pygame.Rect(self.position, self.stretch_size)
+        else:
+            # Shared with every other volcano of the same size
+            self.volcano_image = load_image("Levels/Scopulosus53/assets/volcano.png", self.stretch_size)
 
-        # Create the rectangle for the volcano
-        self.volcano_rect = self.volcano_image.get_rect(topleft=self.position)
+            # Create the rectangle for the volcano
+            self.volcano_rect = self.volcano_image.get_rect(topleft=self.position)
 
         # Create the steam rectangle
         self.steam_correction = steam_correction
         self.steam_rect, self.cloud_rect = self.create_steam_rect(steam_height)
 
         # Initialize spritesheets for steam and cloud animations
-        self.steam_spritesheet = Spritesheet("Levels/Scopulosus53/assets/steam.png", self.steam_rect.width, steam_height)
-        self.steam_frames, self.total_steam_frames, self.frame_speed = self.steam_spritesheet.get_all_frames("steam.png")
+        if headless:
+            self.steam_frames, self.total_steam_frames, self.frame_speed = [], 0, 0
+            self.cloud_frames, self.total_cloud_frames, self.cloud_frame_speed = [], 0, 0
+        else:
+            steam_size = (self.steam_rect.width, steam_height)
+            self.steam_frames, self.total_steam_frames, self.frame_speed = load_animation("Levels/Scopulosus53/assets/steam.png", "steam.png", steam_size)
 
-        self.cloud_spritesheet = Spritesheet("Levels/Scopulosus53/assets/cloud.png", self.cloud_rect.width, int(self.cloud_rect.width * (230 / 500)))
-        self.cloud_frames, self.total_cloud_frames, self.cloud_frame_speed = self.cloud_spritesheet.get_all_frames("cloud.png")
+            cloud_size = (self.cloud_rect.width, int(self.cloud_rect.width * (230 / 500)))
+            self.cloud_frames, self.total_cloud_frames, self.cloud_frame_speed = load_animation("Levels/Scopulosus53/assets/cloud.png", "cloud.png", cloud_size)
 
         self.current_steam_frame = 0
         self.current_cloud_frame = 0
@@ -41,7 +54,7 @@ class Volcano:
         # Timing for animation
         self.steam_push_force = 3000
         self.steam_active = False
-        self.last_toggle_time = time.time()
+        self.last_toggle_time = self.clock.now()
         self.next_toggle_delay = self._calculate_next_toggle_delay()
         self.last_frame_time = 0
         self.last_cloud_frame_time = 0
@@ -71,7 +84,7 @@ class Volcano:
     def update(self):
         """Updates the state of the steam and cloud animations."""
         # Toggle steam state
-        current_time = time.time()
+        current_time = self.clock.now()
         if current_time - self.last_toggle_time >= self.next_toggle_delay:
             self.steam_active = not self.steam_active
             self.last_toggle_time = current_time
@@ -95,15 +108,15 @@ class Volcano:
         if transformed_rects:
             # Draw steam animation
             if self.steam_active:
-                steam_image = self.steam_frames[self.current_steam_frame]
+                steam_image = zoomed(self.steam_frames[self.current_steam_frame], camera.zoom)
                 screen.blit(steam_image, transformed_rects["steam"].topleft)
 
                 # Draw cloud animation
-                cloud_image = self.cloud_frames[self.current_cloud_frame]
+                cloud_image = zoomed(self.cloud_frames[self.current_cloud_frame], camera.zoom)
                 screen.blit(cloud_image, transformed_rects["cloud"].topleft)
 
             # Draw volcano image
-            screen.blit(self.volcano_image, transformed_rects["base"].topleft)
+            screen.blit(zoomed(self.volcano_image, camera.zoom), transformed_rects["base"].topleft)
 
     def interact_with_player(self, player, volcanoes):
         """
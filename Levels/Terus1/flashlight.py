@@ -1,7 +1,15 @@
 import pygame
 import math
 
+try:
+    import numpy
+except ImportError:
+    numpy = None  # Gradients are built pixel by pixel instead
+
 class Flashlight:
+    _gradient_cache = {}
+    _beam_cache = {}
+
     def __init__(self, screen, intensity, radius=300, beam_width=75, flipped=False):
         self.screen = screen
         self.radius = radius
@@ -12,32 +20,63 @@ class Flashlight:
         self.pos = pygame.Vector2(screen.get_width() // 2, screen.get_height() // 2)
         self.flipped = flipped 
 
-        # Create a pre-rendered gradient
-        self.gradient_surface = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
-        self.gradient_surface.fill((0, 0, 0, 0))
-        for x in range(self.radius * 2):
-            for y in range(self.radius * 2):
-                dist = ((x - self.radius) ** 2 + (y - self.radius) ** 2) ** 0.5
-                if dist <= self.radius:
-                    intensity = (self.intensity * (1 - dist / self.radius))
-                    color = (255, 255, 0, intensity)  # Yellow color
-                    self.gradient_surface.set_at((x, y), color)
+        # Pre-rendered gradient, shared by every flashlight with the same radius and intensity
+        self.gradient_surface = Flashlight.build_gradient(self.radius, self.intensity)
 
-    def draw(self, camera, surface):
+    @staticmethod
+    def build_gradient(radius, intensity):
         """
-        Draws the flashlight beam onto the provided surface.
+        Returns a yellow radial gradient that fades from intensity alpha in the center to nothing at the radius.
+        Gradients are memoized by (radius, intensity), so recreating a flashlight (restarts, checkpoint2) is free.
 
-        :param camera: The camera object to adjust the flashlight position.
-        :param surface: The pygame surface to draw the flashlight on.
+        :param radius: Radius of the gradient in pixels.
+        :param intensity: Alpha value at the center of the gradient.
         """
-        # Transform flashlight position based on the camera
-        adjusted_pos = pygame.Vector2(
-            (self.pos[0] - camera.camera_rect.x) * camera.zoom,
-            (self.pos[1] - camera.camera_rect.y) * camera.zoom
-        )
+        key = (radius, intensity)
+        if key in Flashlight._gradient_cache:
+            return Flashlight._gradient_cache[key]
+
+        gradient_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        gradient_surface.fill((0, 0, 0, 0))
+
+        if numpy is not None:
+            offsets = numpy.arange(radius * 2) - radius
+            dist = numpy.sqrt(offsets[:, None] ** 2 + offsets[None, :] ** 2)  # Indexed [x, y] like surfarray
+            inside = dist <= radius
+
+            pixels = pygame.surfarray.pixels3d(gradient_surface)
+            pixels[inside] = (255, 255, 0)  # Yellow color
+            del pixels  # Unlocks the surface
+
+            alpha = pygame.surfarray.pixels_alpha(gradient_surface)
+            alpha[inside] = numpy.clip(intensity * (1 - dist[inside] / radius), 0, 255).astype(numpy.uint8)
+            del alpha
+        else:
+            for x in range(radius * 2):
+                for y in range(radius * 2):
+                    dist = ((x - radius) ** 2 + (y - radius) ** 2) ** 0.5
+                    if dist <= radius:
+                        color = (255, 255, 0, int(intensity * (1 - dist / radius)))  # Yellow color
+                        gradient_surface.set_at((x, y), color)
+
+        Flashlight._gradient_cache[key] = gradient_surface
+        return gradient_surface
+
+    def beam_sprite(self, zoom):
+        """
+        Returns the finished beam (gradient masked to the beam arc, flipped when facing left) for the given zoom.
+        Sprites are cached by (zoom, flipped) on top of the gradient they were built from, so after the first frame
+        drawing the flashlight is a single blit.
+
+        :param zoom: Zoom of the camera the beam is drawn for.
+        """
+        key = (self.radius, self.intensity, self.beam_width, zoom, self.flipped)
+        beam_surface = Flashlight._beam_cache.get(key)
+        if beam_surface is not None:
+            return beam_surface
 
         # Adjust beam size for the current zoom
-        scaled_radius = int(self.radius * camera.zoom)
+        scaled_radius = int(self.radius * zoom)
         scaled_gradient = pygame.transform.scale(
             self.gradient_surface,
             (scaled_radius * 2, scaled_radius * 2)
@@ -65,12 +104,21 @@ class Flashlight:
         if self.flipped:
             beam_surface = pygame.transform.flip(beam_surface, True, False)
 
-        # Calculate offset for centered drawing
-        offset_x = beam_surface.get_width() // 2
-        offset_y = beam_surface.get_height() // 2
+        Flashlight._beam_cache[key] = beam_surface
+        return beam_surface
+
+    def draw(self, camera, surface):
+        """
+        Draws the flashlight beam onto the provided surface.
+
+        :param camera: The camera object to adjust the flashlight position.
+        :param surface: The pygame surface to draw the flashlight on.
+        """
+        # Transform flashlight position based on the camera
+        adjusted_x = (self.pos[0] - camera.camera_rect.x) * camera.zoom
+        adjusted_y = (self.pos[1] - camera.camera_rect.y) * camera.zoom
 
-        # Store the rotated beam (useful for interactions)
-        self.rotated_beam = beam_surface
+        beam_surface = self.beam_sprite(camera.zoom)
 
-        # Draw the beam on the provided surface
-        surface.blit(beam_surface, (adjusted_pos[0] - offset_x, adjusted_pos[1] - offset_y))
+        # Draw the beam centered on the flashlight position
+        surface.blit(beam_surface, (adjusted_x - beam_surface.get_width() // 2, adjusted_y - beam_surface.get_height() // 2))
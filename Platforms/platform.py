@@ -1,4 +1,5 @@
 import pygame
+from asset_cache import load_image
 
 class Platform:
     __slots__ = ['name', 'position', 'start_position', 'is_moving', 'movement_range', 'speed', 'animation_frames', 
@@ -32,17 +33,18 @@ class Platform:
         return pygame.Rect(self.position.x, self.position.y, self.dimensions[0], self.dimensions[1])
 
     def load_image(self, image_path):
-        if not image_path:
+        # Headless simulations have no display to convert images for (and never draw them)
+        if not image_path or pygame.display.get_surface() is None:
             return None
         if image_path not in Platform._image_cache:
             try:
-                Platform._image_cache[image_path] = pygame.image.load(image_path).convert_alpha()
+                Platform._image_cache[image_path] = load_image(image_path)
             except FileNotFoundError:
                 Platform._image_cache[image_path] = None
         return Platform._image_cache[image_path]
 
     def update(self, dt):
-        if self.is_moving == 'True':
+        if self.is_moving:
             movement = pygame.Vector2(
                 self.direction.x * self.movement_range.x,
                 self.direction.y * self.movement_range.y
@@ -0,0 +1,146 @@
+import pygame
+from collections import OrderedDict
+from camera import world_boxes
+from zoom_cache import zoomed
+
+class StaticPlatformLayer:
+    def __init__(self, platforms, death_platforms, chunk_size=512, max_chunks=48):
+        """
+        Pre-renders platforms that never move into world-space chunk surfaces, so a frame only has to blit the few chunks
+        that intersect the camera instead of building a surface for every platform.
+
+        Args:
+            platforms (list): All platforms in the level (moving platforms are skipped and drawn every frame instead).
+            death_platforms (list): Platforms that should stay invisible.
+            chunk_size (int): Width and height of a chunk in world pixels.
+            max_chunks (int): How many baked chunks to keep before the least recently seen ones are dropped.
+        """
+        self.chunk_size = chunk_size
+        self.max_chunks = max_chunks
+        self.death_platforms = death_platforms
+        self.moving_platforms = [platform for platform in platforms if platform.is_moving]
+        self.static_platforms = [platform for platform in platforms if not platform.is_moving]
+        self.static_boxes = world_boxes(platform.rect for platform in self.static_platforms)  # For zoomed cameras, see draw_zoomed
+        self.chunk_platforms = {}
+        self.baked_chunks = OrderedDict()
+
+        for platform in platforms:
+            if platform.is_moving:
+                continue
+
+            rect = platform.rect
+            for chunk_x in range(rect.left // chunk_size, (rect.right - 1) // chunk_size + 1):
+                for chunk_y in range(rect.top // chunk_size, (rect.bottom - 1) // chunk_size + 1):
+                    self.chunk_platforms.setdefault((chunk_x, chunk_y), []).append(platform)
+
+    def platform_color(self, platform, flashlight_enabled):
+        """Returns the fill color for a platform without an image, or None if it shouldn't be drawn."""
+        if platform in self.death_platforms:
+            return None
+        elif flashlight_enabled:
+            return (0, 0, 0)
+        return platform.color
+
+    def draw_platform(self, surface, platform, rect, flashlight_enabled, zoom=1):
+        """Draws a single platform at an already transformed rect (with its image at the camera's zoom)."""
+        if platform.image:
+            surface.blit(zoomed(platform.image, zoom), rect.topleft, (0, 0, rect.width, rect.height))
+        else:
+            color = self.platform_color(platform, flashlight_enabled)
+            if color:
+                pygame.draw.rect(surface, color, rect)
+
+    def _bake_chunk(self, key, flashlight_enabled):
+        chunk_x, chunk_y = key
+        origin_x, origin_y = chunk_x * self.chunk_size, chunk_y * self.chunk_size
+        chunk = pygame.Surface((self.chunk_size, self.chunk_size), pygame.SRCALPHA)
+        chunk.fill((0, 0, 0, 0))
+
+        for platform in self.chunk_platforms[key]:
+            rect = platform.rect.move(-origin_x, -origin_y)
+            self.draw_platform(chunk, platform, rect, flashlight_enabled)
+
+        # Colors are remembered so a checkpoint changing color rebakes only the chunks it is in
+        colors = [platform.color for platform in self.chunk_platforms[key]]
+        return chunk, colors
+
+    def _get_chunk(self, key, flashlight_enabled):
+        cache_key = (key, flashlight_enabled)
+        baked = self.baked_chunks.get(cache_key)
+
+        if baked is not None:
+            chunk, colors = baked
+            if all(platform.color == color for platform, color in zip(self.chunk_platforms[key], colors)):
+                self.baked_chunks.move_to_end(cache_key)
+                return chunk
+
+        self.baked_chunks[cache_key] = self._bake_chunk(key, flashlight_enabled)
+        self.baked_chunks.move_to_end(cache_key)
+
+        while len(self.baked_chunks) > self.max_chunks:
+            self.baked_chunks.popitem(last=False)
+
+        return self.baked_chunks[cache_key][0]
+
+    def chunks_in(self, rect):
+        """Returns the keys of the chunks with static platforms that overlap a world-space rect."""
+        size = self.chunk_size
+        return [(chunk_x, chunk_y)
+                for chunk_x in range(rect.left // size, (rect.right - 1) // size + 1)
+                for chunk_y in range(rect.top // size, (rect.bottom - 1) // size + 1)
+                if (chunk_x, chunk_y) in self.chunk_platforms]
+
+    def is_baked(self, key, flashlight_enabled):
+        return (key, flashlight_enabled) in self.baked_chunks
+
+    def prefetch(self, key, flashlight_enabled):
+        """Bakes a chunk ahead of time so the frame it scrolls into view doesn't have to."""
+        if key in self.chunk_platforms:
+            self._get_chunk(key, flashlight_enabled)
+
+    def evict(self, keep):
+        """
+        Drops the baked chunks that aren't in keep. Returns how many were dropped.
+
+        Args:
+            keep (set): Chunk keys to keep baked.
+        """
+        dropped = [cache_key for cache_key in self.baked_chunks if cache_key[0] not in keep]
+        for cache_key in dropped:
+            del self.baked_chunks[cache_key]
+        return len(dropped)
+
+    def draw(self, surface, camera, flashlight_enabled):
+        """
+        Blits the baked chunks under the camera, then draws moving platforms on top.
+
+        Args:
+            surface (pygame.Surface): Surface of the viewport being drawn.
+            camera (Camera object): Camera of the viewport (only zoom 1 is supported by the baked chunks).
+            flashlight_enabled (bool): Whether platforms without images are drawn black for the flashlight.
+        """
+        size = self.chunk_size
+        view = camera.camera_rect
+        view_x, view_y = int(view.x), int(view.y)
+
+        for chunk_x in range(view.left // size, (view.right - 1) // size + 1):
+            for chunk_y in range(view.top // size, (view.bottom - 1) // size + 1):
+                if (chunk_x, chunk_y) in self.chunk_platforms:
+                    chunk = self._get_chunk((chunk_x, chunk_y), flashlight_enabled)
+                    surface.blit(chunk, (chunk_x * size - view_x, chunk_y * size - view_y))
+
+        self.draw_moving(surface, camera, flashlight_enabled)
+
+    def draw_moving(self, surface, camera, flashlight_enabled):
+        moving_boxes = world_boxes(platform.rect for platform in self.moving_platforms)
+        for index, platform_rect in camera.visible_batch(moving_boxes, surface.get_size()):
+            self.draw_platform(surface, self.moving_platforms[index], platform_rect, flashlight_enabled, camera.zoom)
+
+    def draw_zoomed(self, surface, camera, flashlight_enabled):
+        """
+        Draws the visible platforms one by one for cameras that aren't at zoom 1, which the baked chunks don't support.
+        Static platforms are transformed and culled in one batch, from boxes packed when the layer was built.
+        """
+        for index, platform_rect in camera.visible_batch(self.static_boxes, surface.get_size()):
+            self.draw_platform(surface, self.static_platforms[index], platform_rect, flashlight_enabled, camera.zoom)
+        self.draw_moving(surface, camera, flashlight_enabled)
@@ -1,4 +1,5 @@
 import pygame, math
+from spatial_grid import nearby
 
 class Player():
 
@@ -33,7 +34,8 @@ class Player():
         self.on_ground = False
         tolerance = 10
 
-        for platform in platforms:
+        # Only platforms around the player can be touched this step, the margin covers the push-out from earlier collisions
+        for platform in nearby(platforms, player_rect.inflate(128, 128)):
             platform_rect = platform.rect
 
             if player_rect.colliderect(platform_rect):
@@ -96,7 +98,7 @@ class Player():
 
         # Check if the player is interacting with a ladder
         on_ladder = None
-        for ladder in ladders:
+        for ladder in nearby(ladders, self.rect):
             if self.rect.colliderect(ladder.rect):
                 on_ladder = ladder
                 break
@@ -132,7 +134,7 @@ class Player():
 
         # Check if the player is interacting with a hook
         attached_to_hook = None
-        for hook in hooks:
+        for hook in nearby(hooks, self.rect):
             if self.rect.colliderect(hook.hitbox):
                 attached_to_hook = hook
                 break
@@ -211,12 +213,8 @@ class Player():
 
         head_zone = pygame.Rect(player_rect.x, player_rect.y - 64, player_rect.width, 32)
 
-        for platform in platforms:
-            platform_rect = pygame.Rect(
-                platform.position.x, platform.position.y, platform.dimensions[0], platform.dimensions[1]
-            )
-
-            if head_zone.colliderect(platform_rect):
+        for platform in nearby(platforms, head_zone):
+            if head_zone.colliderect(platform.rect):
                 self.under_platform = True
                 break
 
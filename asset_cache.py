@@ -0,0 +1,61 @@
+"""Process-wide cache for images and spritesheet animations. Entities that use the same file at the same size (ex: the
+volcanoes in Scopulosus53) share one loaded and scaled surface instead of each loading and rescaling their own copy."""
+
+import pygame
+from sprites import Spritesheet
+
+_images = {}
+_animations = {}
+
+def load_image(path, size=None, alpha=True, source=None):
+    """
+    Loads an image once per (path, size) and returns the shared surface. Don't draw on the returned surface, copy it first.
+
+    Args:
+        path (str): Path to the image (relative to the project folder).
+        size (tuple): (width, height) to scale the image to, None to keep its original size.
+        alpha (bool): Convert with per-pixel alpha (convert_alpha) instead of convert.
+        source (pygame.Surface): The file already decoded (ex: by the AssetManager's worker thread), converted instead of
+            reading the file again.
+    """
+    key = (path, tuple(size) if size else None, alpha)
+    image = _images.get(key)
+
+    if image is None:
+        if size:
+            image = pygame.transform.scale(load_image(path, alpha=alpha, source=source), key[1])
+        else:
+            image = source if source is not None else pygame.image.load(path)
+            image = image.convert_alpha() if alpha else image.convert()
+        _images[key] = image
+
+    return image
+
+def is_loaded(path, size=None, alpha=True):
+    return (path, tuple(size) if size else None, alpha) in _images
+
+def load_animation(sheet_path, name, size):
+    """
+    Slices an animation out of a spritesheet once per (sheet, name, frame size) and returns the shared result.
+
+    Args:
+        sheet_path (str): Path to the spritesheet png (its json metadata sits next to it).
+        name (str): Name of the animation in the metadata.
+        size (tuple): (width, height) every frame is scaled to.
+
+    Returns:
+        tuple: (frames, total_frames, frame_speed) like Spritesheet.get_all_frames
+    """
+    key = (sheet_path, name, tuple(size))
+    animation = _animations.get(key)
+
+    if animation is None:
+        animation = Spritesheet(sheet_path, size[0], size[1]).get_all_frames(name)
+        _animations[key] = animation
+
+    return animation
+
+def clear():
+    """Drops every cached asset (ex: when memory matters more than the next level load)."""
+    _images.clear()
+    _animations.clear()
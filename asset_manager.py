@@ -0,0 +1,149 @@
+"""Preloads images before they are needed. Every level has a manifest of the images it loads when it starts (worked out
+from its compiled level and the entities it declares), and the menus ask for the level the player is most likely to play
+next. Files are decoded in a worker thread, then converted to the display format a few at a time on the main thread, so
+loading into asset_cache happens while the player is still in a menu instead of when the level starts."""
+
+import time
+import queue
+import threading
+from collections import deque
+import pygame
+import asset_cache
+from level_bundle import get_compiled_level
+from level_entities import ENTITY_TYPES
+
+WEB_ENVIRONMENT = False
+try:
+    import pygbag.fs # type: ignore
+    WEB_ENVIRONMENT = True
+except ImportError:
+    pass  # Browsers have no threads, files are decoded a few per frame on the main thread instead
+
+# Menu and HUD images, shared by every screen
+MENU_ASSETS = [
+    ("assets/levelSelect/stars_bg.png", None),
+    ("assets/levelSelect/Terus1.png", None),
+    ("assets/levelSelect/Scopulosus53.png", None),
+    ("assets/levelSelect/Magnus25.png", None),
+    ("assets/gameControls/backward.png", None),
+    ("assets/gameControls/forward.png", None),
+    ("assets/gameControls/keyboard_enter.png", None),
+    ("assets/gameControls/keyboard_arrow_left.png", None),
+    ("assets/gameControls/keyboard_arrow_left_outline.png", None),
+    ("assets/gameControls/keyboard_arrow_right.png", None),
+    ("assets/gameControls/keyboard_arrow_right_outline.png", None),
+    ("Buttons/tutorial_button.png", None),
+    ("Buttons/lilbutton.png", None),
+    ("Buttons/reload_button.png", None),
+    ("Buttons/pause_button.png", None),
+]
+
+def level_manifest(level_name, window_size=(1000, 700)):
+    """
+    Returns (path, size) of every image a level loads when it starts: background, artifacts, platform images and the
+    images of its entities. Compiles the level too (see level_bundle.get_compiled_level), so starting it doesn't have to.
+
+    Args:
+        level_name (str): Name of the level.
+        window_size (tuple): Size the background is scaled to.
+    """
+    level = get_compiled_level(level_name)
+    manifest = [(f'Levels/{level_name}/assets/bg_image.png', tuple(window_size))]
+
+    if level.artifact_anchors:
+        manifest.append((f'Levels/{level_name}/assets/artifact1.png', None))
+
+    image_paths = [record[-2] for record in level.records if record[-2]]
+    manifest.extend((path, None) for path in dict.fromkeys(image_paths))
+
+    for kind, entity_type in ENTITY_TYPES.items():
+        if entity_type.assets:
+            for data in level.data.get(kind) or []:
+                manifest.extend(entity_type.assets(data))
+
+    return list(dict.fromkeys(manifest))
+
+class AssetManager:
+    def __init__(self, threaded=not WEB_ENVIRONMENT, frame_budget=0.004):
+        """
+        Queue of images to load into asset_cache ahead of time.
+
+        Args:
+            threaded (bool): Decode files in a worker thread (the main thread still converts them, which needs the display).
+            frame_budget (float): Seconds pump() may spend converting images each frame.
+        """
+        self.threaded = threaded
+        self.frame_budget = frame_budget
+        self.waiting = deque()
+        self.decoded = {}
+        self.requests = queue.Queue()
+        self.worker = None
+
+    @property
+    def busy(self):
+        """True while images are waiting to be loaded (menus keep calling pump() every frame until then)."""
+        return bool(self.waiting)
+
+    def prefetch(self, assets, urgent=False):
+        """
+        Queues images to be loaded by pump().
+
+        Args:
+            assets (list): (path, size) of each image, like level_manifest returns.
+            urgent (bool): Load them before everything already queued (ex: the level the player just picked).
+        """
+        new = [asset for asset in assets if asset not in self.waiting and not asset_cache.is_loaded(*asset)]
+        if urgent:
+            self.waiting.extendleft(reversed(new))
+        else:
+            self.waiting.extend(new)
+
+        if self.threaded:
+            if self.worker is None:
+                self.worker = threading.Thread(target=self._decode, daemon=True)
+                self.worker.start()
+            for path in dict.fromkeys(path for path, size in new if not asset_cache.is_loaded(path)):
+                self.requests.put(path)
+
+    def prefetch_level(self, level_name, urgent=False):
+        """Queues a level's manifest, see level_manifest."""
+        surface = pygame.display.get_surface()
+        if surface is not None:
+            self.prefetch(level_manifest(level_name, surface.get_size()), urgent)
+
+    def _decode(self):
+        while True:
+            path = self.requests.get()
+            if path in self.decoded or asset_cache.is_loaded(path):
+                continue
+            try:
+                self.decoded[path] = pygame.image.load(path)
+            except (FileNotFoundError, pygame.error):
+                self.decoded[path] = None  # Left for whatever loads it for real to report
+
+    def pump(self):
+        """Loads queued images until this frame's budget is spent. Call it once per menu frame."""
+        deadline = time.perf_counter() + self.frame_budget
+
+        while self.waiting and time.perf_counter() < deadline:
+            path, size = self.waiting[0]
+            source = None
+
+            if self.threaded and not asset_cache.is_loaded(path):
+                if path not in self.decoded:
+                    return  # Still being decoded, picked up next frame
+                source = self.decoded[path]
+                if source is None:
+                    self.waiting.popleft()
+                    continue
+
+            self.waiting.popleft()
+            try:
+                asset_cache.load_image(path, size, source=source)
+            except (FileNotFoundError, pygame.error):
+                pass
+
+            if source is not None:
+                del self.decoded[path]  # asset_cache has it now, other sizes of it are scaled from there
+
+assets = AssetManager()
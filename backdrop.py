@@ -0,0 +1,68 @@
+import pygame
+
+try:
+    from PIL import Image, ImageFilter
+except ImportError:
+    Image = None  # Menus fall back to the smoothscale blur
+
+class Backdrop:
+    def __init__(self, screen, max_blur_radius, blur_duration=0, use_pil=False):
+        """
+        Freezes the current frame and hands out blurred copies of it for menus drawn on top of the game.
+        Each blur radius is only computed once, so a menu with a finished (or no) blur animation does no blurring per frame.
+
+        Args:
+            screen (pygame.Surface): Surface to freeze (the frame the menu was opened over).
+            max_blur_radius (float): Blur radius once the animation has finished.
+            blur_duration (float): Seconds it takes to animate the blur from 0 to max_blur_radius (0 for no animation).
+            use_pil (bool): Use PIL's GaussianBlur instead of the smoothscale fast path (only if PIL is installed).
+        """
+        self.frozen = screen.copy()
+        self.max_blur_radius = max_blur_radius
+        self.blur_duration = blur_duration
+        self.use_pil = use_pil and Image is not None
+        self._blurred = {}
+
+    def radius_at(self, time_elapsed):
+        """Returns the blur radius for the given seconds since the menu opened."""
+        if time_elapsed < self.blur_duration:
+            # Quantized to half pixels so an animating blur reuses frames instead of blurring every loop
+            return round((time_elapsed / self.blur_duration) * self.max_blur_radius * 2) / 2
+        return self.max_blur_radius
+
+    def done(self, time_elapsed):
+        """True once the blur animation has finished."""
+        return time_elapsed >= self.blur_duration
+
+    def get(self, time_elapsed):
+        """
+        Returns the blurred frozen frame for the given seconds since the menu opened.
+
+        Args:
+            time_elapsed (float): Seconds since the menu opened.
+        """
+        radius = self.radius_at(time_elapsed)
+        blurred = self._blurred.get(radius)
+
+        if blurred is None:
+            blurred = self._blur(radius)
+            self._blurred[radius] = blurred
+
+        return blurred
+
+    def _blur(self, radius):
+        if radius <= 0:
+            return self.frozen
+
+        size = self.frozen.get_size()
+
+        if self.use_pil:
+            pil_image = Image.frombytes("RGBA", size, pygame.image.tobytes(self.frozen, "RGBA"))
+            blurred_image = pil_image.filter(ImageFilter.GaussianBlur(radius=radius))
+            return pygame.image.frombytes(blurred_image.tobytes(), size, "RGBA")
+
+        # Fast path: shrinking and growing back with smoothscale averages neighbouring pixels, which looks close to a gaussian
+        factor = 1 + radius / 2
+        small_size = (max(1, int(size[0] / factor)), max(1, int(size[1] / factor)))
+        small = pygame.transform.smoothscale(self.frozen, small_size)
+        return pygame.transform.smoothscale(small, size)
@@ -6,7 +6,28 @@ from Levels.Scopulosus53.volcanoes import Volcano
 from Levels.Magnus25.ladder import Ladder
 from Levels.Magnus25.hook import Hook
 
+try:
+    import numpy
+except ImportError:
+    numpy = None  # apply_batch transforms boxes one by one instead
+
+def world_boxes(rects):
+    """
+    Packs world-space rects into the struct of arrays Camera.apply_batch takes: (xs, ys, widths, heights), as numpy
+    arrays when numpy is installed and lists otherwise. Build it once for things that don't move.
+
+    :param rects: pygame.Rects (or (x, y, width, height) tuples) in world space.
+    """
+    rects = [tuple(rect) for rect in rects]
+    if numpy is not None:
+        return numpy.array(rects, dtype=float).reshape(-1, 4).T
+    if not rects:
+        return [], [], [], []
+    return tuple(list(column) for column in zip(*rects))
+
 class Camera:
+    batch_threshold = 32  # Below this many boxes numpy's overhead costs more than it saves
+
     def __init__(self, width, height, window_size, zoom=1.0):
         """
         Initializes the camera.
@@ -96,6 +117,49 @@ class Camera:
         
         return obj
 
+    def apply_batch(self, boxes, view_size=None):
+        """
+        Transforms many world-space boxes at once, without building a pygame.Rect per box.
+
+        :param boxes: (xs, ys, widths, heights) from world_boxes.
+        :param view_size: (width, height) of the surface drawn on, boxes outside of it aren't visible (default: window_size).
+        :return: (rects, visible): screen-space (x, y, width, height) of every box, truncated like pygame.Rect does, and
+            whether each one overlaps the surface. Both are numpy arrays when numpy is installed and enough boxes are
+            given, lists otherwise.
+        """
+        xs, ys, widths, heights = boxes
+        view_width, view_height = view_size or self.window_size
+        camera_x, camera_y, zoom = self.camera_rect.x, self.camera_rect.y, self.zoom
+
+        if numpy is not None and len(xs) >= self.batch_threshold:
+            rects = numpy.stack((
+                (numpy.asarray(xs) - camera_x) * zoom,
+                (numpy.asarray(ys) - camera_y) * zoom,
+                numpy.asarray(widths) * zoom,
+                numpy.asarray(heights) * zoom
+            ), axis=1).astype(int)
+            left, top, width, height = rects.T
+            visible = (left < view_width) & (top < view_height) & (left + width > 0) & (top + height > 0)
+            return rects, visible
+
+        rects = [(int((x - camera_x) * zoom), int((y - camera_y) * zoom), int(width * zoom), int(height * zoom)) for x, y, width, height in zip(xs, ys, widths, heights)]
+        visible = [left < view_width and top < view_height and left + width > 0 and top + height > 0 for left, top, width, height in rects]
+        return rects, visible
+
+    def visible_batch(self, boxes, view_size=None):
+        """
+        Returns (index, pygame.Rect) for the boxes that overlap the surface, in the order they were packed in. Only the
+        visible boxes get a pygame.Rect.
+
+        :param boxes: (xs, ys, widths, heights) from world_boxes.
+        :param view_size: (width, height) of the surface drawn on (default: window_size).
+        """
+        rects, visible = self.apply_batch(boxes, view_size)
+        if numpy is not None and isinstance(visible, numpy.ndarray):
+            indices = numpy.flatnonzero(visible)
+            return [(index, pygame.Rect(rect)) for index, rect in zip(indices.tolist(), rects[indices].tolist())]
+        return [(index, pygame.Rect(rect)) for index, (rect, shown) in enumerate(zip(rects, visible)) if shown]
+
     def apply_point(self, point):
         """
         Adjusts a single point to be relative to the camera.
@@ -111,11 +175,11 @@ class Camera:
             (point[1] - self.camera_rect.y) * self.zoom,
         )
 
-    def update(self, player, num_of_players):
+    def update(self, player):
         """
         Updates the camera's position based on the mode.
 
-        :param player: The player to track.
+        :param player: The player to track, kept in the middle of the camera's window_size (the size of its viewport).
         """
         if self.manual_mode:
             # Use manual settings for position
@@ -126,23 +190,7 @@ class Camera:
             )
         else:
             if player:
-                min_x = player.position.x - self.margin
-                max_x = player.position.x + self.margin
-                min_y = player.position.y - self.margin
-                max_y = player.position.y + self.margin
-
-                center_x = (min_x + max_x) / 2
-                center_y = (min_y + max_y) / 2
-                
-                if num_of_players == 2:
-                    center_x = (min_x + max_x) / 2 + 250
-                    center_y = (min_y + max_y) / 2
-                elif num_of_players == 3:
-                    center_x = (min_x + max_x) / 2
-                    center_y = (min_y + max_y) / 2 + 295
-                elif num_of_players == 4:
-                    center_x = (min_x + max_x) / 2 + 250
-                    center_y = (min_y + max_y) / 2 + 200
+                center_x, center_y = player.position.x, player.position.y
 
             camera_width = self.window_size[0] / self.zoom
             camera_height = self.window_size[1] / self.zoom
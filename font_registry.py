@@ -0,0 +1,39 @@
+import pygame
+
+# Every (font file, size) the game uses, loaded by warm_up_fonts() while the loading screen is up
+GAME_FONTS = {
+    'fonts/MajorMonoDisplay-Regular.ttf': (20, 30, 35, 40, 50, 55, 60),
+    'fonts/pixelated.ttf': (20, 25, 30, 35, 40, 50),
+    'fonts/pixelated2.ttf': (12, 15)
+}
+
+_fonts = {}
+
+def get_font(font_path, size):
+    """
+    Returns the pygame.font.Font for a font file and size. Each pair is only loaded from disk once, every later call gets
+    the same object, so don't change its style (bold, underline...) in place.
+
+    Args:
+        font_path (str): Path to the .ttf file (ex: 'fonts/pixelated.ttf').
+        size (int): Font size.
+    """
+    font = _fonts.get((font_path, size))
+    if font is None:
+        font = pygame.font.Font(font_path, size)
+        _fonts[(font_path, size)] = font
+    return font
+
+def warm_up_fonts(fonts=GAME_FONTS):
+    """
+    Loads fonts ahead of time so menus and levels don't open TTF files the first time they are shown.
+
+    Args:
+        fonts (dict): Font file -> sizes to load.
+    """
+    for font_path, sizes in fonts.items():
+        for size in sizes:
+            get_font(font_path, size)
+
+def clear():
+    _fonts.clear()
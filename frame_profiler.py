@@ -0,0 +1,117 @@
+import os
+import time
+import pygame
+from collections import deque
+from font_registry import get_font
+
+class FrameProfiler:
+    PHASES = ("input", "physics", "camera", "world", "hud", "flip")
+    PHASE_COLORS = {
+        "input": "#9EBA01",
+        "physics": "#2276c9",
+        "camera": "#c7b61a",
+        "world": "#c7281a",
+        "hud": "#71d6f5",
+        "flip": "#ffffff"
+    }
+
+    def __init__(self, history=240, budget_ms=1000 / 60, enabled=False):
+        """
+        Measures how long each phase of a frame takes and draws an overlay with percentiles and a frame-time graph.
+        Toggle it in game with F3 (or start the game with PARKOUR_PROFILE=1). Nothing is measured while it is hidden.
+
+        Args:
+            history (int): Number of frames kept in the ring buffer (and shown in the graph).
+            budget_ms (float): Frame budget drawn as a line on the graph (16.6 ms for 60 fps).
+            enabled (bool): Start with the overlay visible.
+        """
+        self.budget_ms = budget_ms
+        self.enabled = enabled
+        self.frames = deque(maxlen=history)
+        self.current = None
+        self.last_mark = 0
+        self.font = None
+
+    def handle_event(self, event):
+        """Toggles the overlay when F3 is pressed."""
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            self.enabled = not self.enabled
+            self.frames.clear()
+            self.current = None
+
+    def begin_frame(self):
+        """Starts timing a new frame (anything measured for an unfinished previous frame is dropped)."""
+        if self.enabled:
+            self.current = dict.fromkeys(self.PHASES, 0.0)
+            self.last_mark = time.perf_counter()
+
+    def mark(self, phase):
+        """
+        Adds the time since the last mark to a phase. Marking the same phase several times in a frame adds up, so phases
+        can interleave (ex: camera and world for each split-screen viewport).
+
+        Args:
+            phase (str): One of FrameProfiler.PHASES.
+        """
+        if self.current is not None:
+            now = time.perf_counter()
+            self.current[phase] += (now - self.last_mark) * 1000
+            self.last_mark = now
+
+    def skip(self):
+        """Forgets the time since the last mark (used so drawing the overlay isn't counted in any phase)."""
+        if self.current is not None:
+            self.last_mark = time.perf_counter()
+
+    def end_frame(self):
+        """Pushes the finished frame into the ring buffer."""
+        if self.current is not None:
+            self.frames.append(self.current)
+            self.current = None
+
+    @staticmethod
+    def percentile(values, percent):
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+    def draw(self, surface, position=(10, 440)):
+        """
+        Draws the overlay (phase table and frame-time graph) on a surface.
+
+        Args:
+            surface (pygame.Surface): Surface to draw on (the screen).
+            position (tuple): Top left corner of the overlay.
+        """
+        if not self.enabled or not self.frames:
+            return
+
+        if self.font is None:
+            self.font = get_font('fonts/pixelated2.ttf', 12)
+
+        x, y = position
+        width, graph_height = self.frames.maxlen, 60
+        panel = pygame.Surface((width + 20, 30 + 16 * (len(self.PHASES) + 1) + graph_height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+        surface.blit(panel, (x - 10, y - 10))
+
+        totals = [sum(frame.values()) for frame in self.frames]
+        lines = [("frame", totals, "#ffffff")] + [(phase, [frame[phase] for frame in self.frames], self.PHASE_COLORS[phase]) for phase in self.PHASES]
+
+        for name, values, color in lines:
+            text = f"{name:<8} avg {sum(values) / len(values):5.2f}  p50 {self.percentile(values, 50):5.2f}  p95 {self.percentile(values, 95):5.2f}  p99 {self.percentile(values, 99):5.2f} ms"
+            surface.blit(self.font.render(text, True, color), (x, y))
+            y += 16
+
+        # Frame-time graph, full height is two frame budgets
+        y += 8
+        scale = graph_height / (self.budget_ms * 2)
+        for index, total in enumerate(totals):
+            bar_height = min(graph_height, total * scale)
+            color = "#56911f" if total <= self.budget_ms else "#c7281a"
+            pygame.draw.line(surface, color, (x + index, y + graph_height), (x + index, y + graph_height - bar_height))
+
+        budget_y = y + graph_height - self.budget_ms * scale
+        pygame.draw.line(surface, "#ffffff", (x, budget_y), (x + width, budget_y))
+
+# Profiler shared by every game loop
+profiler = FrameProfiler(enabled=os.environ.get("PARKOUR_PROFILE") == "1")
@@ -0,0 +1,95 @@
+import os
+import sys
+import time
+import asyncio
+from collections import deque
+
+WEB_ENVIRONMENT = sys.platform == "emscripten"
+
+class FrameScheduler:
+    def __init__(self, target_fps=60, fixed_delta_time=1 / 60, max_steps_per_frame=5, history=120):
+        """
+        Paces the game loops: measures how long each frame took, feeds the fixed-step accumulator and sleeps until the next
+        frame is due instead of spinning on asyncio.sleep(0).
+
+        Args:
+            target_fps (int): Frames per second to aim for (0 for uncapped, frames still yield to the event loop).
+            fixed_delta_time (float): Seconds per physics step.
+            max_steps_per_frame (int): Most physics steps a single frame may run. After a hitch (or a menu) the extra time
+                is dropped instead of being caught up, which would make the next frame slower still.
+            history (int): Number of recent frame times kept in frame_times.
+        """
+        self.target_fps = target_fps
+        self.fixed_delta_time = fixed_delta_time
+        self.max_steps_per_frame = max_steps_per_frame
+        self.frame_times = deque(maxlen=history)
+        self.frame_time = 0
+        self.accumulator = 0
+        self.previous_frame = time.perf_counter()
+        self.frame_start = self.previous_frame
+
+    @property
+    def frame_period(self):
+        return 1 / self.target_fps if self.target_fps else 0
+
+    @property
+    def fps(self):
+        """Average frames per second over the recent frames."""
+        if not self.frame_times:
+            return 0
+        return len(self.frame_times) / sum(self.frame_times)
+
+    def reset(self):
+        """Forgets time passed so far, call before a level's first frame (so loading time isn't simulated)."""
+        self.accumulator = 0
+        self.previous_frame = time.perf_counter()
+        self.frame_start = self.previous_frame
+
+    def begin_frame(self):
+        """
+        Starts a frame: measures the time since the previous one and adds it to the accumulator (capped to
+        max_steps_per_frame steps). Returns the measured frame time in seconds.
+        """
+        now = time.perf_counter()
+        self.frame_time = now - self.previous_frame
+        self.previous_frame = now
+        self.frame_start = now
+        self.frame_times.append(self.frame_time)
+
+        self.accumulator = min(self.accumulator + self.frame_time, self.max_steps_per_frame * self.fixed_delta_time)
+        return self.frame_time
+
+    def take_steps(self):
+        """Returns how many fixed physics steps to run this frame and removes them from the accumulator."""
+        steps = int(self.accumulator // self.fixed_delta_time)
+        self.accumulator -= steps * self.fixed_delta_time
+        return steps
+
+    @property
+    def alpha(self):
+        """How far the accumulator is into the next step (0-1), for interpolating between physics states."""
+        return self.accumulator / self.fixed_delta_time
+
+    async def end_frame(self):
+        """
+        Yields to the event loop until the next frame is due. In the browser the page's animation frame paces the game,
+        so this only yields.
+        """
+        if WEB_ENVIRONMENT or not self.target_fps:
+            await asyncio.sleep(0)
+            return
+
+        deadline = self.frame_start + self.frame_period
+        remaining = deadline - time.perf_counter()
+
+        # Sleep most of the wait (sleep can overshoot by a millisecond or so), then yield until the deadline
+        if remaining > 0.002:
+            await asyncio.sleep(remaining - 0.002)
+        while time.perf_counter() < deadline:
+            await asyncio.sleep(0)
+
+        if remaining <= 0:
+            await asyncio.sleep(0)
+
+# Scheduler shared by every game loop (set PARKOUR_FPS to change the target refresh rate, 0 for uncapped)
+scheduler = FrameScheduler(target_fps=int(os.environ.get("PARKOUR_FPS", 60)))
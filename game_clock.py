@@ -0,0 +1,30 @@
+class GameClock:
+    def __init__(self, start=0.0):
+        """
+        Simulation time, advanced by the fixed-step loop instead of read from the OS clock. Everything that times gameplay
+        (volcano steam, storms, the HUD timer) reads from a GameClock, so pausing freezes it and headless or fast-forwarded
+        runs see exactly the same timings as a live game.
+
+        Args:
+            start (float): Time in seconds the clock starts at.
+        """
+        self.time = start
+
+    def now(self):
+        """Returns the simulated time in seconds."""
+        return self.time
+
+    def ticks(self):
+        """Returns the simulated time in whole milliseconds (same unit as pygame.time.get_ticks)."""
+        return int(self.time * 1000)
+
+    def reset(self, start=0.0):
+        """Puts the clock back to start (levels start at 0 like a headless World, so recorded runs replay the same timings)."""
+        self.time = start
+
+    def advance(self, delta_time):
+        """Moves the clock forward by one fixed step (called by update_game_logic)."""
+        self.time += delta_time
+
+# Clock shared by the game, headless Worlds create their own
+default_clock = GameClock()
@@ -1,6 +1,12 @@
 import pygame
-from Platforms.platform import Platform
+import weakref
 from artifacts import Artifact
+from Platforms.static_layer import StaticPlatformLayer
+from game_clock import default_clock
+from frame_profiler import profiler
+from text_cache import render_text, get_digit_atlas
+from zoom_cache import zoomed
+from asset_cache import load_image
 
 WEB_ENVIRONMENT = False
 try:
@@ -16,6 +22,9 @@ clock = pygame.time.Clock()
 
 pygame.display.set_caption("Parkour Dash")
 
+# Pre-rendered platform layers, one per loaded level (dropped together with the level's platforms)
+_static_layers = weakref.WeakKeyDictionary()
+
 def centerText(text, position):
     """
     Centers given text on the screen
@@ -26,224 +35,84 @@ def centerText(text, position):
     """
     return text.get_rect(center=position)
 
-def load_platforms(platform_data, level_name):
-
-    platforms = []
-    platform_names = []
-    level_data = platform_data[level_name]['platforms']
-    platform_names = list(level_data.keys())
-    list_item = 0
-
-    for platform_name, platform_data in level_data.items():
-        platform_dimensions = (platform_data['width'], platform_data['height'])
-        platform_position = (platform_data['x-position'], platform_data['y-position'])
-        
-        if platform_data['is_moving'] == 'True':
-            platform_speed = platform_data['speed']
-            platform_direction = (platform_data['x-direction'], platform_data['y-direction'])
-            platform_movement_range = (platform_data['x-movement_range'], platform_data['y-movement_range'])
-
-        else:
-            platform_speed, platform_direction, platform_movement_range = 0, (0, 0), (0, 0)
-
-        if 'image_path' in platform_data:
-            platform_image_path = platform_data['image_path']
-        
-        else:
-            platform_image_path = None
-            
-
-        
-
-        platform = Platform(
-            name = platform_names[list_item],
-            position = platform_position,
-            is_moving = platform_data['is_moving'],
-            image_path = platform_image_path,
-            dimensions = platform_dimensions,
-            speed = platform_speed,
-            direction = platform_direction,
-            movement_range = platform_movement_range,
-            color = platform_data['color']
-        )
- 
-        platforms.append(platform)
-        list_item += 1
-
-    return platforms
-
 def introduce_controls(blit_jumpslide):
 
-    font = pygame.font.Font('fonts/pixelated.ttf', 40)
-
-    print_jumpslide_tutorial1 = font.render("press jump and slide keys", True, ("#00f7f7"))
-    print_jumpslide_tutorial2 = font.render("together to leap", True, ("#00f7f7"))
-    jumpslide_tutorial_rect1 = print_jumpslide_tutorial1.get_rect(center=(500, 180))
-    jumpslide_tutorial_rect2 = print_jumpslide_tutorial2.get_rect(center=(500, 220))
-    
     if blit_jumpslide:
+        print_jumpslide_tutorial1 = render_text('fonts/pixelated.ttf', 40, "press jump and slide keys", ("#00f7f7"))
+        print_jumpslide_tutorial2 = render_text('fonts/pixelated.ttf', 40, "together to leap", ("#00f7f7"))
+        jumpslide_tutorial_rect1 = print_jumpslide_tutorial1.get_rect(center=(500, 180))
+        jumpslide_tutorial_rect2 = print_jumpslide_tutorial2.get_rect(center=(500, 220))
+
         screen.blit(print_jumpslide_tutorial1, jumpslide_tutorial_rect1)
         screen.blit(print_jumpslide_tutorial2, jumpslide_tutorial_rect2)
 
-def reload_map(active_players, platforms, reset_position, artifacts):
-
-    for platform in platforms:
-        platform.reset()
-
-    for player in active_players:
-        player.reload(reset_position)
-
-    for artifact in artifacts:
-        artifact.reset()
-
-def display_controls(num_of_players, introduced_controls_state, print_player1_controls, print_player3_controls, print_player4_controls):
+def display_controls(num_of_players, introduced_controls_state, print_controls):
     """
     Displays the control instructions for players on the game screen.
     Parameters:
     num_of_players (int): The number of players in the game.
-    show_controls (bool): Flag to determine whether to show the controls on the screen.
     introduced_controls_state (dict): A dictionary indicating which controls have been introduced.
         Keys include "introduced_jumping" and "introduced_sliding".
-    print_player1_controls (list): List of control instructions for player 1.
-    print_player3_controls (list): List of control instructions for player 3.
-    print_player4_controls (list): List of control instructions for player 4.
+    print_controls (list): (control instructions, color) of every player, from determine_blitted_controls.
     Returns:
     None
     """
-    
-    font = pygame.font.Font('fonts/pixelated2.ttf', 15)
-    
-    full_p1_controls = print_player1_controls
-    full_p2_controls = [
-            'Left: ‹',
-            'Right: ›',
-            'Jump: ↑',
-            'Slide: ↓'
-        ]
-    full_p3_controls = print_player3_controls
-    full_p4_controls = print_player4_controls
-
-    p1_controls = []
-    p2_controls = []
-    p3_controls = []
-    p4_controls = []
 
     if not introduced_controls_state["introduced_jumping"]:
-        p1_controls = [full_p1_controls[0], full_p1_controls[1]]
-
-        if num_of_players > 1:
-            p2_controls = [full_p2_controls[0], full_p2_controls[1]]
-        if num_of_players > 2:
-            p3_controls = [full_p3_controls[0], full_p3_controls[1]]
-        if num_of_players > 3:
-            p4_controls = [full_p4_controls[0], full_p4_controls[1]]
-
-
-    
-    elif not introduced_controls_state["introduced_sliding"] and introduced_controls_state["introduced_jumping"]:
-
-        p1_controls = [full_p1_controls[0], full_p1_controls[1], full_p1_controls[2]]
-        
-        if num_of_players > 1:
-            p2_controls = [full_p2_controls[0], full_p2_controls[1], full_p2_controls[2]]
-
-        if num_of_players > 2:
-            p3_controls = [full_p3_controls[0], full_p3_controls[1], full_p3_controls[2]]
-
-        if num_of_players > 3:
-            p4_controls = [full_p4_controls[0], full_p4_controls[1], full_p4_controls[2]]        
-        
+        shown_controls = 2
+    elif not introduced_controls_state["introduced_sliding"]:
+        shown_controls = 3
     else:
+        shown_controls = None
 
-        p1_controls = full_p1_controls       
-        
-        if num_of_players > 1:
-            p2_controls = full_p2_controls
-        
-        if num_of_players > 2:       
-            p3_controls = full_p3_controls
-        
-        if num_of_players > 3:
-            p4_controls = full_p4_controls
-    
     general_controls = [
         'P: Game pause',
         'R: Respawn'
         ]
 
-    x_position = 30
-    vertical_displacement = 150
-    
-    for p1_control in p1_controls:
-        print_p1_controls = font.render(p1_control, True, ("#9EBA01"))
-        p1_control_rect = print_p1_controls.get_rect(topleft=(x_position, vertical_displacement))
-        screen.blit(print_p1_controls, p1_control_rect)
-        vertical_displacement += 30
+    # Players go down the left side two at a time, then down the right side under the general controls, and so on
+    vertical_displacement = {'left': 150, 'right': 150}
 
-    if num_of_players > 1:
+    for number, (controls, color) in enumerate(print_controls[:num_of_players]):
+        side = 'left' if number % 4 < 2 else 'right'
 
-        for p2_control in p2_controls:
-            print_p2_controls = font.render(p2_control, True, ("#2276c9"))
-            p2_control_rect = print_p2_controls.get_rect(topleft=(x_position, vertical_displacement))
-            screen.blit(print_p2_controls, p2_control_rect)
-            vertical_displacement += 30
+        for control in controls[:shown_controls]:
+            print_control = render_text('fonts/pixelated2.ttf', 15, control, color)
+            if side == 'left':
+                control_rect = print_control.get_rect(topleft=(30, vertical_displacement[side]))
+            else:
+                control_rect = print_control.get_rect(topright=(965, vertical_displacement[side]))
+            screen.blit(print_control, control_rect)
+            vertical_displacement[side] += 30
 
     x_position = 965
     vertical_displacement = 10
 
     for general_control in general_controls:
-        print_general_controls = font.render(general_control, True, ("#ffffff"))
+        print_general_controls = render_text('fonts/pixelated2.ttf', 15, general_control, ("#ffffff"))
         general_control_rect = print_general_controls.get_rect(topright=(x_position, vertical_displacement))
         screen.blit(print_general_controls, general_control_rect)
         vertical_displacement += 30
 
-    vertical_displacement = 150
-
-    if num_of_players > 2:
-
-        for p3_control in p3_controls:
-            print_p3_controls = font.render(p3_control, True, ("#c7b61a"))
-            p3_control_rect = print_p3_controls.get_rect(topright=(x_position, vertical_displacement))
-            screen.blit(print_p3_controls, p3_control_rect)
-            vertical_displacement += 30
-
-    if num_of_players > 3:
-
-        for p4_control in p4_controls:
-            print_p4_controls = font.render(p4_control, True, ("#c7281a"))
-            p4_control_rect = print_p4_controls.get_rect(topright=(x_position, vertical_displacement))
-            screen.blit(print_p4_controls, p4_control_rect)
-            vertical_displacement += 30
-
-def determine_blitted_controls(p1_controls, p3_controls, p4_controls):
-
-    print_player1_controls = []
-    print_player3_controls = []
-    print_player4_controls = []
-
-    for action, key in p1_controls.items():
-        print_player1_controls.append(f'{action}: {key}')
-
-    for action, key in p3_controls.items():
-        print_player3_controls.append(f'{action}: {key}')
-
-    for action, key in p4_controls.items():
-            print_player4_controls.append(f'{action}: {key}')
+def determine_blitted_controls(show_controls, colors):
+    """
+    Returns (control instructions, color) for every player in show_controls (ex: (["Left: a", "Right: d"], "#9EBA01")).
 
-    return print_player1_controls, print_player3_controls, print_player4_controls
-            
-def update_game_logic(delta_time, active_players, platforms, keys, position, popup_active, ladders, hooks):
+    Args:
+        show_controls (dict): The "show_controls" players of Players/player_controls.json.
+        colors (dict): The "colors" players of Players/player_controls.json.
+    """
+    print_controls = []
 
-    for player in active_players:
-        player.update(delta_time, keys, platforms, position, popup_active, ladders, hooks)
-        player.collisions(platforms)
+    for number in range(len(show_controls)):
+        player = f'player{number + 1}'
+        print_controls.append(([f'{action}: {key}' for action, key in show_controls[player].items()], colors[player]))
 
-    for platform in platforms:
-        platform.update(delta_time)
+    return print_controls
 
-def update_timer(start_timer):
+def update_timer(start_timer, clock=default_clock):
     
-    counting_time = pygame.time.get_ticks() - start_timer
+    counting_time = clock.ticks() - start_timer
     counting_minutes = counting_time // 60000  # Minutes
     counting_seconds = (counting_time % 60000) // 1000  # Seconds
     counting_milliseconds = (counting_time % 1000) // 10
@@ -251,203 +120,94 @@ def update_timer(start_timer):
 
     return counting_string
 
-def render_timer(font, text_color, counting_string):
-    print_timer = font.render(counting_string, True, text_color)
-    timer_rect = print_timer.get_rect(topright=(990, 100))
-    screen.blit(print_timer, timer_rect)
+def render_timer(font_path, font_size, text_color, counting_string):
+    # The timer changes every frame, so it is drawn from pre-rendered digits instead of rendering the string
+    get_digit_atlas(font_path, font_size, text_color).draw(screen, counting_string, topright=(990, 100))
 
-def get_special_platforms(platforms, level_name):
-
-    next_checkpoints = list()
-    deathforms = list()
-    checkpoint_num = 1
-    deathpoint_num = 1
-
-    for platform in platforms:
-
-        if platform.name == "starting-platform":
-            spawn_point = (platform.position.x + (platform.dimensions[0] / 2), platform.position.y - platform.dimensions[1])
-
-        elif platform.name == f"checkpoint{checkpoint_num}":
-            next_checkpoints.append(platform)
-            checkpoint_num += 1
-
-        elif platform.name == "finish-line":
-            finish_line = platform
-
-        elif platform.name == f"death-form{deathpoint_num}":
-            deathforms.append(platform)
-            deathpoint_num += 1
-
-    return spawn_point, deathforms, next_checkpoints, finish_line
-
-def is_flashlight_touching_platform(flashlight_beam, platform_rect, flashlight):
+def renderSplitscreenLayout(compositor, active_players, bg_image, platforms, death_platforms, artifacts, collected_artifacts, flashlight, volcanoes, ladders, hooks):
     """
-    Checks for collision between the flashlight beam and a platform.
+    Draws every player's view into its viewport of the compositor's canvas, then puts the canvas on the screen.
+    The world is culled once for all viewports against what they show together, then each viewport only draws what its
+    own camera can see. Nothing is animated here: volcanoes advance with the fixed steps (LevelScene.update).
 
     Args:
-        flashlight_beam: The rotated surface of the flashlight beam.
-        platform_rect: The pygame.Rect object representing the platform's position.
-        flashlight: Flashlight object (if applicable).
-
-    Returns:
-        True if the beam collides with the platform, False otherwise.
+        compositor (SplitscreenCompositor): Viewports, cameras and scaled backgrounds of the level.
+        active_players (list): Players, one viewport each.
+        bg_image (pygame.Surface): Level background, scaled to the viewport size once per layout.
     """
+    compositor.follow(active_players)
+    profiler.mark("camera")
+
+    # Drawn in this order, under the platforms
+    world_layers = [
+        compositor.cull(volcanoes or (), volcano_bounds),
+        compositor.cull(ladders or (), lambda ladder: ladder.rect),
+        # Hooks are indexed by the end of their rope, so the ones hanging into view from further away are searched for too
+        compositor.cull(hooks or (), hook_bounds, margin=512),
+    ]
+    uncollected = compositor.cull((artifact for artifact in artifacts if artifact not in collected_artifacts and not artifact.collected), lambda artifact: artifact.rect)
+
+    for player, camera, sub in compositor.views(active_players):
+        sub.blit(compositor.background(bg_image, sub.get_size()), (0, 0))
+        for layer in world_layers:
+            for obj in compositor.visible(camera, layer):
+                obj.draw(camera, sub)
+        render_game_objects(platforms, active_players, camera, flashlight, death_platforms, surface=sub)
+        render_artifacts(compositor.visible(camera, uncollected), camera, collected_artifacts, surface=sub)
+
+    compositor.draw_dividers()
+    screen.blit(compositor.canvas, (0, 0))
+    profiler.mark("world")
+
+def volcano_bounds(volcano):
+    """World-space area a volcano is drawn in, steam and cloud included."""
+    return volcano.volcano_rect.union(volcano.steam_rect).union(volcano.cloud_rect)
+
+def hook_bounds(hook):
+    """World-space area a hook can be drawn in over its whole swing."""
+    return pygame.Rect(hook.pivot.x - hook.length, hook.pivot.y, hook.length * 2, hook.length).inflate(hook.hitbox.width * 2, hook.hitbox.height * 2)
+
+def get_static_layer(platforms, death_platforms):
+    """
+    Returns the pre-rendered static platform layer for a level, building it the first time the level's platforms are seen.
 
-    # Get the rectangle of the beam surface
-    beam_rect = flashlight_beam.get_rect()
-
-    # Calculate the center of the beam rectangle based on the flashlight's position
-    beam_center_x = flashlight.pos.x - beam_rect.width // 2
-    beam_center_y = flashlight.pos.y - beam_rect.height // 2
-    beam_rect.center = (beam_center_x, beam_center_y)
-
-    # Check for collision between the beam rectangle and platform rectangle
-    return beam_rect.colliderect(platform_rect)
-
-def renderSplitscreenLayout(canvas, active_players, num_of_players, bg_image, platforms, camera, death_platforms, artifacts, collected_artifacts, flashlight, volcanoes, ladders, hooks, subscreens):
-    bg_image_scaled = pygame.transform.scale(bg_image, subscreens[0].get_size())
-    for i, sub in enumerate(subscreens):
-        if i < len(active_players):
-            player = active_players[i]
-            camera.update(player, num_of_players)
-            sub.blit(bg_image_scaled, (0, 0))
-            if volcanoes:
-                for volcano in volcanoes:
-                    volcano.update()
-                    volcano.draw(camera, sub)
-            if ladders:
-                for ladder in ladders:
-                    ladder.draw(camera, sub)
-            if hooks:
-                for hook in hooks:
-                    hook.draw(camera, sub)
-            render_game_objects(platforms, active_players, camera, flashlight, death_platforms, surface=sub)
-            render_artifacts(artifacts, camera, collected_artifacts, surface=sub)
-
-    # Draw dividing lines to separate the views
-    if len(active_players) == 2:
-        pygame.draw.line(canvas, (255, 255, 255), (window_size[0] // 2, 0), (window_size[0] // 2, window_size[1]), 5)
-    elif len(active_players) == 3:
-        pygame.draw.line(canvas, (255, 255, 255), (0, window_size[1] // 3), (window_size[0], window_size[1] // 3), 5)
-        pygame.draw.line(canvas, (255, 255, 255), (0, (2 * window_size[1]) // 3), (window_size[0], (2 * window_size[1]) // 3), 5)
-    elif len(active_players) == 4:
-        pygame.draw.line(canvas, (255, 255, 255), (window_size[0] // 2, 0), (window_size[0] // 2, window_size[1]), 5)
-        pygame.draw.line(canvas, (255, 255, 255), (0, window_size[1] // 2), (window_size[0], window_size[1] // 2), 5)
-
-    # Blit the subsurfaces to the main screen using hardware acceleration
-    canvas.lock()  # Lock the canvas for direct pixel access
-    for i, sub in enumerate(subscreens):
-        if len(active_players) == 1:
-            screen.blit(sub, (0, 0))
-        elif len(active_players) == 2:
-            x = (i % 2) * (window_size[0] // 2)
-            y = 0
-            screen.blit(sub, (x, y))
-        elif len(active_players) == 3:
-            x = 0 
-            y = (i % 3) * (window_size[1] // 3)
-            screen.blit(sub, (x, y))
-        elif len(active_players) == 4:
-            x = (i % 2) * (window_size[0] // 2)
-            y = (i // 2) * (window_size[1] // 2)
-            screen.blit(sub, (x, y))
-    canvas.unlock()  # Unlock the canvas after pixel access
-
-def getSplitscreenLayout(canvas, active_players):
-    if len(active_players) == 1:
-        p1_camera = pygame.Rect(0, 0, window_size[0], window_size[1])
-        subscreens = [canvas.subsurface(p1_camera)]
-    elif len(active_players) == 2:
-        p1_camera = pygame.Rect(0, 0, window_size[0] // 2, window_size[1])
-        p2_camera = pygame.Rect(window_size[0] // 2, 0, window_size[0] // 2, window_size[1])
-        subscreens = [canvas.subsurface(p1_camera), canvas.subsurface(p2_camera)]
-    elif len(active_players) == 3:
-        p1_camera = pygame.Rect(0, 0, window_size[0], window_size[1] // 3)
-        p2_camera = pygame.Rect(0, window_size[1] // 3, window_size[0], window_size[1] // 3)
-        p3_camera = pygame.Rect(0, (2 * window_size[1]) // 3, window_size[0], window_size[1] // 3)
-        subscreens = [canvas.subsurface(p1_camera), canvas.subsurface(p2_camera), canvas.subsurface(p3_camera)]
-    else:
-        p1_camera = pygame.Rect(0, 0, window_size[0] // 2, window_size[1] // 2)
-        p2_camera = pygame.Rect(window_size[0] // 2, 0, window_size[0] // 2, window_size[1] // 2)
-        p3_camera = pygame.Rect(0, window_size[1] // 2, window_size[0] // 2, window_size[1] // 2)
-        p4_camera = pygame.Rect(window_size[0] // 2, window_size[1] // 2, window_size[0] // 2, window_size[1] // 2)
-        subscreens = [
-                    canvas.subsurface(p1_camera),
-                    canvas.subsurface(p2_camera),
-                    canvas.subsurface(p3_camera),
-                    canvas.subsurface(p4_camera),
-                ]
-        
-    return subscreens
+    Args:
+        platforms (SpatialGrid): Platforms returned by load_platforms
+        death_platforms (list): Platforms that should stay invisible
+    """
+    layer = _static_layers.get(platforms)
+    if layer is None:
+        layer = StaticPlatformLayer(platforms, death_platforms)
+        _static_layers[platforms] = layer
+    return layer
 
 def render_game_objects(platforms, active_players, camera, flashlight, death_platforms, surface):
     """
     Renders game objects on a specific surface, respecting camera and flashlight settings.
-    Implements culling and GPU acceleration for optimization.
+    Static platforms come from the pre-rendered chunk layer, only moving platforms and players are drawn every frame.
     """
     # If the flashlight is on, draw the beam first relative to the subscreen
     if flashlight.on:
-        flashlight_surface = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-        flashlight.draw(camera, flashlight_surface)
-        surface.blit(flashlight_surface, (0, 0))
-
-    # Create a single surface for all platforms to minimize blit calls
-    platforms_surface = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-    platforms_surface.fill((0, 0, 0, 0))  # Transparent initially
-
-    # Use a batch renderer for GPU acceleration
-    batch = pygame.sprite.RenderUpdates()
-
-    for platform in platforms:
-        platform_rect = camera.apply(platform)
-
-        # Culling: Skip rendering if the platform is outside the camera view
-        if not surface.get_rect().colliderect(platform_rect):
-            continue
+        flashlight.draw(camera, surface)
 
-        # Create a temporary surface for platform rendering
-        platform_surface = pygame.Surface((platform_rect.width, platform_rect.height), pygame.SRCALPHA)
-        platform_surface.fill((0, 0, 0, 0))  # Transparent initially
-
-        if hasattr(platform, 'image') and platform.image:
-            platform_surface.blit(platform.image, (0, 0))
-        else:
-            if platform in death_platforms:
-                platform_color = (0, 0, 0, 0)  # Transparent for death platforms
-            elif flashlight.enabled:
-                platform_color = (0, 0, 0)  # Black for platforms without images when flashlight is on
-            else:
-                platform_color = platform.color  # Default platform color
-
-            # Draw the platform color if no image is rendered
-            if platform_color:
-                pygame.draw.rect(platform_surface, platform_color, (0, 0, platform_rect.width, platform_rect.height))
-
-        # Draw the platform on the platforms surface
-        platforms_surface.blit(platform_surface, platform_rect)
+    layer = get_static_layer(platforms, death_platforms)
+    surface_rect = surface.get_rect()
 
-    # Blit all platforms at once
-    surface.blit(platforms_surface, (0, 0))
+    if camera.zoom == 1:
+        layer.draw(surface, camera, flashlight.enabled)
+    else:
+        # Baked chunks are only valid at zoom 1, so zoomed cameras draw each visible platform directly
+        layer.draw_zoomed(surface, camera, flashlight.enabled)
 
     # Render players
     for player in active_players:
         player_rect = camera.apply(player)
 
         # Culling: Skip rendering if the player is outside the camera view
-        if not surface.get_rect().colliderect(player_rect):
+        if not surface_rect.colliderect(player_rect):
             continue
 
-        scaled_rect = pygame.Rect(
-            player_rect.x,
-            player_rect.y,
-            int(player_rect.width),
-            int(player_rect.height)
-        )
-        pygame.draw.rect(surface, player.color, scaled_rect)
-
-    # Update the batch renderer
-    batch.draw(surface)
+        pygame.draw.rect(surface, player.color, player_rect)
 
 def getArtifacts(platforms, level_name):
     artifact_platform_num = 1
@@ -459,17 +219,24 @@ def getArtifacts(platforms, level_name):
             artifact_platforms.append(platform)
             artifact_platform_num += 1
 
+    anchors = [(platform.position.x + platform.dimensions[0] // 2 - 50, platform.position.y - 75) for platform in artifact_platforms]
+    return artifacts_at(anchors, level_name)
+
+def artifacts_at(anchors, level_name):
+    """
+    Creates a level's artifacts at positions that were already worked out (ex: CompiledLevel.artifact_anchors).
+
+    Args:
+        anchors (list): (x, y) of every artifact.
+        level_name (str): Level whose artifact image is used.
+    """
     # Artifact image
-    artifact_image1 = pygame.image.load(f"Levels/{level_name}/assets/artifact1.png")
+    artifact_image1 = load_image(f"Levels/{level_name}/assets/artifact1.png")
 
     # Create Artifact objects and add them to a sprite group
     artifacts = pygame.sprite.Group()
-    for i, platform in enumerate(artifact_platforms):
+    for i, artifact_position in enumerate(anchors):
         artifact_name = f"Artifact {i + 1}"  # Generate a unique name
-        artifact_position = (
-            platform.position.x + platform.dimensions[0] // 2 - 50,
-            platform.position.y - 75
-        )
         artifacts.add(Artifact(artifact_image1, artifact_position, artifact_name))
     return artifacts
 
@@ -486,17 +253,11 @@ def render_artifacts(artifacts, camera, collected_artifacts, surface):
 
     for artifact in artifacts:
         if artifact not in collected_artifacts and not artifact.collected:
-            artifact_rect = camera.apply(artifact)  # Apply camera transformation
-            artifact_scaled_rect = pygame.Rect(
-                artifact_rect.x,
-                artifact_rect.y,
-                int(artifact_rect.width * camera.zoom),
-                int(artifact_rect.height * camera.zoom)
-            )
-            surface.blit(artifact.image, artifact_scaled_rect.center)  # Draw artifact image at top-left of scaled rect
-
-def render_artifact_count(text_color, artifacts_collected, font=pygame.font.Font('fonts/MajorMonoDisplay-Regular.ttf', 20)):
-    print_artifacts_collected = font.render(f"artifact fragments collected: {artifacts_collected}", True, text_color)
+            artifact_rect = camera.apply(artifact)  # Already scaled by the camera's zoom
+            surface.blit(zoomed(artifact.image, camera.zoom), artifact_rect.center)  # Drawn from the center of its rect
+
+def render_artifact_count(text_color, artifacts_collected):
+    print_artifacts_collected = render_text('fonts/MajorMonoDisplay-Regular.ttf', 20, f"artifact fragments collected: {artifacts_collected}", text_color)
     artifact_counter_rect = print_artifacts_collected.get_rect(center=(window_size[0] // 2 - 20, 20))
     screen.blit(print_artifacts_collected, artifact_counter_rect)
 
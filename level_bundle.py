@@ -0,0 +1,314 @@
+"""Compiled levels. `python level_bundle.py` turns every Levels/<name>/<name>.json into a Levels/<name>/<name>.lvl bundle:
+a versioned header followed by typed platform records, the resolved spawn point, checkpoints, death platforms, artifact
+anchors and the platforms' spatial grid, so starting a level doesn't parse json or look platforms up by name. Anything
+else in the level json (popups, ladders, hooks, volcanoes...) is stored as is. A bundle is only used while it matches its
+json, edited levels fall back to the json until they are compiled again."""
+
+import os
+import json
+import zlib
+import struct
+import pygame
+from Platforms.platform import Platform
+from spatial_grid import platform_grid
+
+try:
+    import mmap
+except ImportError:
+    mmap = None  # Not available in every browser build, bundles are read into memory instead
+
+BUNDLE_MAGIC = b"PKLV"
+BUNDLE_VERSION = 1
+LEVEL_TYPES = ["escape", "scrolling"]
+NO_STRING = 0xFFFFFFFF
+NO_PLATFORM = -1
+
+# magic, version, level type, source size, source crc32, platform count, checkpoint count, death platform count,
+# artifact count, grid cell count, grid entry count, string table size, extras size, grid cell size, finish line index,
+# spawn x, spawn y
+HEADER = struct.Struct("<4sHHIIIIIIIIIIIiff")
+# x, y, speed, x-direction, y-direction, x-movement_range, y-movement_range, width, height, is_moving, grid cell range
+# (left, top, right, bottom), name, image_path and color offsets in the string table
+PLATFORM = struct.Struct("<7fii?4i3I")
+ARTIFACT = struct.Struct("<ff")
+CELL = struct.Struct("<iiII")
+
+class CompiledLevel:
+    def __init__(self, level_name, level_type, records, spawn_point, checkpoints, death_platforms, finish_line, artifact_anchors, cells, cell_size, data):
+        """
+        Everything needed to start a level, already resolved. Built from a bundle (from_bundle) or from the level json
+        (from_json, which is also what the compile step uses).
+
+        Args:
+            level_name (str): Name of the level.
+            level_type (str): 'scrolling' or 'escape'.
+            records (list): One tuple per platform, laid out like PLATFORM followed by name, image_path and color strings.
+            spawn_point (tuple): Where players spawn on the starting platform.
+            checkpoints (list): Platform indexes of checkpoint1, checkpoint2... in order.
+            death_platforms (list): Platform indexes of death-form1, death-form2...
+            finish_line (int): Platform index of the finish line (NO_PLATFORM if there is none).
+            artifact_anchors (list): (x, y) of every artifact, in artifact-platform order.
+            cells (dict): Spatial grid buckets, (cell x, cell y) -> platform indexes.
+            cell_size (int): Size of a grid cell.
+            data (dict): The rest of the level json (camera_dimensions, popups, entities...).
+        """
+        self.level_name = level_name
+        self.level_type = level_type
+        self.records = records
+        self.spawn_point = spawn_point
+        self.checkpoints = checkpoints
+        self.death_platforms = death_platforms
+        self.finish_line = finish_line
+        self.artifact_anchors = artifact_anchors
+        self.cells = cells
+        self.cell_size = cell_size
+        self.data = data
+
+    @property
+    def camera_dimensions(self):
+        return self.data.get('camera_dimensions')
+
+    @classmethod
+    def from_json(cls, levels_data, level_name, cell_size=256):
+        """
+        Resolves a level json the same way load_platforms, get_special_platforms and getArtifacts do.
+
+        Args:
+            levels_data (dict): Parsed level json.
+            level_name (str): Name of the level in the json.
+            cell_size (int): Size of the spatial grid cells.
+        """
+        level = levels_data[level_name]
+        records = []
+        cells = {}
+        spawn_point, finish_line = None, NO_PLATFORM
+        checkpoints, death_platforms, artifact_anchors = [], [], []
+
+        for index, (name, platform) in enumerate(level['platforms'].items()):
+            is_moving = platform['is_moving'] == 'True'
+            if is_moving:
+                movement = (platform['speed'], platform['x-direction'], platform['y-direction'], platform['x-movement_range'], platform['y-movement_range'])
+            else:
+                movement = (0, 0, 0, 0, 0)
+
+            rect = pygame.Rect(platform['x-position'], platform['y-position'], platform['width'], platform['height'])
+            cell_range = (rect.left // cell_size, rect.top // cell_size, (rect.right - 1) // cell_size, (rect.bottom - 1) // cell_size)
+            for cell_x in range(cell_range[0], cell_range[2] + 1):
+                for cell_y in range(cell_range[1], cell_range[3] + 1):
+                    cells.setdefault((cell_x, cell_y), []).append(index)
+
+            records.append((platform['x-position'], platform['y-position'], *movement, platform['width'], platform['height'], is_moving, *cell_range, name, platform.get('image_path'), platform['color']))
+
+            if name == "starting-platform":
+                spawn_point = (platform['x-position'] + (platform['width'] / 2), platform['y-position'] - platform['height'])
+            elif name == f"checkpoint{len(checkpoints) + 1}":
+                checkpoints.append(index)
+            elif name == "finish-line":
+                finish_line = index
+            elif name == f"death-form{len(death_platforms) + 1}":
+                death_platforms.append(index)
+
+            if name == f"artifact-platform{len(artifact_anchors) + 1}":
+                artifact_anchors.append((platform['x-position'] + platform['width'] // 2 - 50, platform['y-position'] - 75))
+
+        data = {key: value for key, value in level.items() if key not in ('platforms', 'level_type')}
+        return cls(level_name, level['level_type'], records, spawn_point, checkpoints, death_platforms, finish_line, artifact_anchors, cells, cell_size, data)
+
+    def build_platforms(self):
+        """Creates fresh Platform objects (in their starting positions) and their grid, from the prebuilt buckets."""
+        platforms = []
+        object_cells = {}
+
+        for index, record in enumerate(self.records):
+            x, y, speed, direction_x, direction_y, range_x, range_y, width, height, is_moving, left, top, right, bottom, name, image_path, color = record
+            platforms.append(Platform(
+                name = name,
+                position = (x, y),
+                is_moving = is_moving,
+                image_path = image_path,
+                dimensions = (width, height),
+                speed = speed,
+                direction = (direction_x, direction_y),
+                movement_range = (range_x, range_y),
+                color = color
+            ))
+            object_cells[index] = (left, top, right, bottom)
+
+        return platform_grid(platforms, cell_size=self.cell_size, cells=self.cells, object_cells=object_cells)
+
+    def special_platforms(self, platforms):
+        """Returns spawn_point, death_platforms, checkpoints and finish_line, like get_special_platforms."""
+        finish_line = platforms[self.finish_line] if self.finish_line != NO_PLATFORM else None
+        return self.spawn_point, [platforms[index] for index in self.death_platforms], [platforms[index] for index in self.checkpoints], finish_line
+
+    def to_bytes(self, source_size=0, source_crc=0):
+        strings = bytearray()
+        offsets = {}
+
+        def string(value):
+            if value is None:
+                return NO_STRING
+            if value not in offsets:
+                offsets[value] = len(strings)
+                strings.extend(value.encode('utf-8') + b"\0")
+            return offsets[value]
+
+        platforms = b"".join(PLATFORM.pack(*record[:14], string(record[14]), string(record[15]), string(record[16])) for record in self.records)
+        checkpoints = struct.pack(f"<{len(self.checkpoints)}I", *self.checkpoints)
+        death_platforms = struct.pack(f"<{len(self.death_platforms)}I", *self.death_platforms)
+        artifacts = b"".join(ARTIFACT.pack(*anchor) for anchor in self.artifact_anchors)
+
+        cell_table, entries = [], []
+        for (cell_x, cell_y), indexes in self.cells.items():
+            cell_table.append(CELL.pack(cell_x, cell_y, len(entries), len(indexes)))
+            entries.extend(indexes)
+        grid = b"".join(cell_table) + struct.pack(f"<{len(entries)}I", *entries)
+        extras = json.dumps(self.data).encode('utf-8')
+
+        header = HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, LEVEL_TYPES.index(self.level_type), source_size, source_crc,
+                             len(self.records), len(self.checkpoints), len(self.death_platforms), len(self.artifact_anchors),
+                             len(self.cells), len(entries), len(strings), len(extras), self.cell_size, self.finish_line,
+                             *(self.spawn_point or (0, 0)))
+        return header + platforms + checkpoints + death_platforms + artifacts + grid + bytes(strings) + extras
+
+    @staticmethod
+    def read_header(buffer):
+        """Returns the unpacked header of a bundle, or None if it isn't a bundle of the current version."""
+        if len(buffer) < HEADER.size:
+            return None
+        header = HEADER.unpack_from(buffer, 0)
+        if header[0] != BUNDLE_MAGIC or header[1] != BUNDLE_VERSION:
+            return None
+        return header
+
+    @classmethod
+    def from_bundle(cls, buffer, level_name):
+        """Reads a bundle (bytes or an mmap). Returns None if it was written by a different version."""
+        header = cls.read_header(buffer)
+        if header is None:
+            return None
+
+        (_, _, level_type, _, _, platform_count, checkpoint_count, death_count, artifact_count, cell_count, entry_count,
+         strings_size, extras_size, cell_size, finish_line, spawn_x, spawn_y) = header
+        offset = HEADER.size
+
+        raw_records = list(PLATFORM.iter_unpack(buffer[offset:offset + platform_count * PLATFORM.size]))
+        offset += platform_count * PLATFORM.size
+        checkpoints = list(struct.unpack_from(f"<{checkpoint_count}I", buffer, offset))
+        offset += checkpoint_count * 4
+        death_platforms = list(struct.unpack_from(f"<{death_count}I", buffer, offset))
+        offset += death_count * 4
+        artifact_anchors = list(ARTIFACT.iter_unpack(buffer[offset:offset + artifact_count * ARTIFACT.size]))
+        offset += artifact_count * ARTIFACT.size
+        cell_table = list(CELL.iter_unpack(buffer[offset:offset + cell_count * CELL.size]))
+        offset += cell_count * CELL.size
+        entries = struct.unpack_from(f"<{entry_count}I", buffer, offset)
+        offset += entry_count * 4
+        strings = bytes(buffer[offset:offset + strings_size])
+        offset += strings_size
+        data = json.loads(bytes(buffer[offset:offset + extras_size]).decode('utf-8'))
+
+        def string(string_offset):
+            if string_offset == NO_STRING:
+                return None
+            return strings[string_offset:strings.index(b"\0", string_offset)].decode('utf-8')
+
+        records = [record[:14] + (string(record[14]), string(record[15]), string(record[16])) for record in raw_records]
+        cells = {(cell_x, cell_y): list(entries[start:start + count]) for cell_x, cell_y, start, count in cell_table}
+
+        return cls(level_name, LEVEL_TYPES[level_type], records, (spawn_x, spawn_y), checkpoints, death_platforms, finish_line, artifact_anchors, cells, cell_size, data)
+
+def source_path(level_name):
+    return f'Levels/{level_name}/{level_name}.json'
+
+def bundle_path(level_name):
+    return f'Levels/{level_name}/{level_name}.lvl'
+
+def _crc(path):
+    with open(path, 'rb') as source:
+        return zlib.crc32(source.read())
+
+def compile_level(level_name):
+    """Writes Levels/<level_name>/<level_name>.lvl from the level json and returns its path."""
+    with open(source_path(level_name), 'rb') as source:
+        raw = source.read()
+
+    level = CompiledLevel.from_json(json.loads(raw), level_name)
+    with open(bundle_path(level_name), 'wb') as bundle:
+        bundle.write(level.to_bytes(len(raw), zlib.crc32(raw)))
+    return bundle_path(level_name)
+
+def load_bundle(level_name):
+    """
+    Loads a level's compiled bundle. Returns None (so the caller falls back to the json) if there is no bundle, it was
+    written by another version, the json changed since it was compiled, or it is damaged (ex: a truncated copy).
+    """
+    path = bundle_path(level_name)
+    if not os.path.exists(path) or os.path.getsize(path) < HEADER.size:
+        return None  # mmap can't map an empty file
+
+    with open(path, 'rb') as bundle:
+        buffer = mmap.mmap(bundle.fileno(), 0, access=mmap.ACCESS_READ) if mmap else bundle.read()
+        try:
+            header = CompiledLevel.read_header(buffer)
+            if header is None:
+                return None
+
+            # A json newer than its bundle was probably edited, but checkouts touch both, so check the contents too
+            source = os.stat(source_path(level_name))
+            if source.st_size != header[3]:
+                return None
+            if source.st_mtime > os.stat(path).st_mtime and _crc(source_path(level_name)) != header[4]:
+                return None
+
+            try:
+                return CompiledLevel.from_bundle(buffer, level_name)
+            except (ValueError, struct.error, UnicodeDecodeError, json.JSONDecodeError):
+                return None
+        finally:
+            if mmap:
+                buffer.close()
+
+_compiled_levels = {}
+
+def cached_level(level_name):
+    """Returns the level compiled earlier in this session if its json hasn't changed since (restarts read nothing)."""
+    cached = _compiled_levels.get(level_name)
+    if cached and cached[0] == os.stat(source_path(level_name)).st_mtime:
+        return cached[1]
+    return None
+
+def remember_level(level_name, level):
+    _compiled_levels[level_name] = (os.stat(source_path(level_name)).st_mtime, level)
+    return level
+
+def read_json(path):
+    with open(path, 'r') as source:
+        return json.load(source)
+
+def get_compiled_level(level_name, load_json=read_json):
+    """
+    Returns a level's CompiledLevel from memory, its bundle, or its json, in that order.
+
+    Args:
+        level_name (str): Name of the level.
+        load_json (function): Takes the json's path and returns it parsed (the game passes one that works in browsers).
+    """
+    level = cached_level(level_name)
+    if level is None:
+        level = load_bundle(level_name)
+    if level is None:
+        level = CompiledLevel.from_json(load_json(source_path(level_name)), level_name)
+    return remember_level(level_name, level)
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compile level json files into .lvl bundles.")
+    parser.add_argument("levels", nargs="*", help="Level folder names (default: every level)")
+    args = parser.parse_args()
+
+    levels = args.levels or sorted(name for name in os.listdir('Levels') if os.path.exists(source_path(name)))
+    for level_name in levels:
+        path = compile_level(level_name)
+        print(f"{level_name}: {os.path.getsize(source_path(level_name))} bytes of json -> {path} ({os.path.getsize(path)} bytes)")
@@ -0,0 +1,158 @@
+"""Entities declared in a level's json file next to "platforms" (ladders, hooks, volcanoes...). Every kind of entity is
+registered once in ENTITY_TYPES with the function that builds it, and load_entities builds whatever a level declares.
+Heavy entities can be registered as lazy, these are only built once a player gets close to them."""
+
+import pygame
+from spatial_grid import SpatialGrid, hook_grid
+from game_clock import default_clock
+
+class EntityType:
+    def __init__(self, kind, build, collection=list, bounds=None, lazy=False, margin=1000, assets=None):
+        """
+        A kind of entity that can be declared in a level json.
+
+        Args:
+            kind (str): Key of the entity list in the level json (ex: "ladders").
+            build (function): Takes an entity's json dict, the screen and the clock, and returns the entity.
+            collection (function): Turns the list of built entities into what the game iterates over (ex: hook_grid).
+            bounds (function): Returns the world-space pygame.Rect an entity's json dict covers (required for lazy types).
+            lazy (bool): Only build an entity once a player is within margin pixels of its bounds.
+            margin (int): How far from a lazy entity a player has to be for it to be built (about a screen, so it's built
+                before it scrolls into view).
+            assets (function): Returns the (path, size) of the images an entity's json dict loads, so they can be
+                preloaded before the level starts (see asset_manager.level_manifest).
+        """
+        self.kind = kind
+        self.build = build
+        self.collection = collection
+        self.bounds = bounds
+        self.lazy = lazy
+        self.margin = margin
+        self.assets = assets
+
+    def load(self, entity_data, screen=None, clock=default_clock):
+        if self.lazy:
+            return LazyEntities(entity_data, lambda data: self.build(data, screen, clock), self.bounds, self.margin)
+        return self.collection([self.build(data, screen, clock) for data in entity_data])
+
+ENTITY_TYPES = {}
+
+def register_entity(kind, build, collection=list, bounds=None, lazy=False, margin=1000, assets=None):
+    """Adds a kind of entity to ENTITY_TYPES, see EntityType for the arguments."""
+    ENTITY_TYPES[kind] = EntityType(kind, build, collection, bounds, lazy, margin, assets)
+    return ENTITY_TYPES[kind]
+
+class LazyEntities:
+    def __init__(self, entity_data, build, bounds, margin=1000):
+        """
+        Entities that are only built once something comes near them. Iterating (or len) only covers the built ones, in
+        the order they are declared in, so it can be used anywhere a list of entities is expected.
+
+        Args:
+            entity_data (list): Json dicts of the entities.
+            build (function): Takes one json dict and returns the entity.
+            bounds (function): Returns the world-space pygame.Rect a json dict covers.
+            margin (int): Distance from its bounds at which an entity gets built.
+        """
+        self.entity_data = list(entity_data)
+        self.build = build
+        self.grid = SpatialGrid(range(len(self.entity_data)), get_rect=lambda index: bounds(self.entity_data[index]).inflate(margin * 2, margin * 2))
+        self.built = {}
+        self.entities = []
+
+    def __iter__(self):
+        return iter(self.entities)
+
+    def __len__(self):
+        return len(self.entities)
+
+    @property
+    def pending(self):
+        """How many entities haven't been built yet."""
+        return len(self.entity_data) - len(self.built)
+
+    def realize(self, rect):
+        """
+        Builds the entities whose region overlaps rect. Returns True if anything new was built.
+
+        Args:
+            rect (pygame.Rect): World-space area that is relevant (usually a player's rect).
+        """
+        if len(self.built) == len(self.entity_data):
+            return False
+
+        new = [index for index in self.grid.query(rect) if index not in self.built]
+        for index in new:
+            self.built[index] = self.build(self.entity_data[index])
+
+        if new:
+            self.entities = [self.built[index] for index in sorted(self.built)]
+        return bool(new)
+
+    def release(self, keep_rects):
+        """
+        Drops the built entities whose region doesn't overlap any of keep_rects, they are built again if a player comes
+        back. Returns how many were dropped.
+
+        Args:
+            keep_rects (list): World-space areas that are still relevant.
+        """
+        dropped = [index for index in self.built if not any(self.grid.get_rect(index).colliderect(rect) for rect in keep_rects)]
+        for index in dropped:
+            del self.built[index]
+
+        if dropped:
+            self.entities = [self.built[index] for index in sorted(self.built)]
+        return len(dropped)
+
+    def realize_all(self):
+        for index, data in enumerate(self.entity_data):
+            if index not in self.built:
+                self.built[index] = self.build(data)
+        self.entities = [self.built[index] for index in sorted(self.built)]
+
+def load_entities(level_data, level_name, screen=None, clock=default_clock):
+    """
+    Builds every registered kind of entity a level declares. Returns a dict of kind -> entities (kinds the level doesn't
+    declare are left out).
+
+    Args:
+        level_data (dict): Parsed level json (the same dict load_platforms takes).
+        level_name (str): Name of the level in the json.
+        screen (pygame.Surface): Screen entities draw on (None when headless).
+        clock (GameClock): Clock timed entities (volcanoes) use.
+    """
+    level = level_data[level_name]
+    return {kind: entity_type.load(level[kind], screen, clock) for kind, entity_type in ENTITY_TYPES.items() if level.get(kind)}
+
+def load_popup_data(level_data, level_name):
+    """Returns the popups a level declares (dicts with name, text, button_text and visible)."""
+    return level_data[level_name].get('popups', [])
+
+def _build_ladder(data, screen, clock):
+    from Levels.Magnus25.ladder import Ladder
+    return Ladder(data["x-position"], data["y-position"], data["height"])
+
+def _build_hook(data, screen, clock):
+    from Levels.Magnus25.hook import Hook
+    return Hook(data["x-position"], data["y-position"], data["length"], data["angle"], data["speed"], None)
+
+def _build_volcano(data, screen, clock):
+    from Levels.Scopulosus53.volcanoes import Volcano
+    return Volcano(data["name"], tuple(data["position"]), data["steam_height"], data["steam_correction"], screen, tuple(data["stretch_size"]), clock=clock)
+
+def _volcano_bounds(data):
+    # The volcano itself plus the column of steam above it
+    x, y = data["position"]
+    width, height = data["stretch_size"]
+    return pygame.Rect(x, y - data["steam_height"], width, height + data["steam_height"])
+
+def _ladder_assets(data):
+    return [("Levels/Magnus25/assets/ladder.png", (10, data["height"]))]
+
+def _volcano_assets(data):
+    return [("Levels/Scopulosus53/assets/volcano.png", tuple(data["stretch_size"]))]
+
+register_entity("ladders", _build_ladder, collection=SpatialGrid, assets=_ladder_assets)
+register_entity("hooks", _build_hook, collection=hook_grid)
+register_entity("volcanoes", _build_volcano, bounds=_volcano_bounds, lazy=True, assets=_volcano_assets)
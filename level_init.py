@@ -1,36 +1,134 @@
-import pygame
-from game_init import getArtifacts
-
 """Unlike the game init function, which manages game wide logic, this file is meant to be for storing level-specific logic, such
 as handling custom platforms and other behaviors that don't exist in other levels. This is meant to save space in main.py so that
 its easier to focus on the most critical game logic. Like the game_init file, this file should only store synchronous functions, and
-any async functions should stay in main.py."""
-
-def terusPlatformsInit(platforms, level_name):
-    platform_dict = {platform.name: platform for platform in platforms}
-    show_slide = platform_dict.get("show-slide")
-    show_slide2 = platform_dict.get("jump-platform4")
-    show_checkpoint1_reached = platform_dict.get("checkpoint1")
-    show_checkpoint2_reached = platform_dict.get("checkpoint2")
-    brighten_scene = platform_dict.get("main-artifact-platform")
-    artifacts = getArtifacts(platforms, level_name)
-    return show_slide, show_slide2, show_checkpoint1_reached, show_checkpoint2_reached, brighten_scene, artifacts
-
-def scopulosusPlatformsInit(level_name, platforms):
-    platform_dict = {platform.name: platform for platform in platforms}
-    introduce_volcano = platform_dict.get("introduce-volcano")
-    introduce_deathcano = platform_dict.get("jump-platform4")
-    one_way = platform_dict.get("checkpoint3")
-    artifacts = getArtifacts(platforms, level_name)
-    return introduce_volcano,introduce_deathcano,one_way,artifacts
-
-def tutorialPlatformsInit(platforms, level_name):
-    platform_dict = {platform.name: platform for platform in platforms}
-    intro_to_jumping = platform_dict.get("introduce-jumping")
-    intro_to_sliding = platform_dict.get("introduce-sliding")
-    intro_to_jumpslide = platform_dict.get("introduce-jumpsliding")
-    artifacts = getArtifacts(platforms, level_name)
-    return intro_to_jumping, intro_to_sliding, intro_to_jumpslide, artifacts
+any async functions should stay in main.py. Each level is a LevelPlugin (see level_scene.py) plus a function returning
+the plugins its LevelScene runs with, while its popups, ladders, hooks and volcanoes are declared in its json file."""
+
+import pygame
+from text_cache import render_text
+from game_init import display_controls, introduce_controls, update_tutorial_controls
+from level_scene import LevelPlugin, FlashlightPlugin, StormPlugin
+
+class Terus1Level(LevelPlugin):
+    def setup(self):
+        scene = self.scene
+        self.show_slide = scene.platform_named("show-slide")
+        self.show_slide2 = scene.platform_named("jump-platform4")
+        self.show_checkpoint1_reached = scene.platform_named("checkpoint1")
+        self.show_checkpoint2_reached = scene.platform_named("checkpoint2")
+        self.brighten_scene = scene.platform_named("main-artifact-platform")
+        self.blit_show_slide, self.blit_show_slide2, self.blit_checkpoint1_reached = False, False, False
+        self.scene_brightened = False
+        self.flashlight_broken = False
+
+    def player(self, player):
+        self.blit_show_slide = player.on_platform == self.show_slide
+        self.blit_show_slide2 = player.on_platform == self.show_slide2
+        self.blit_checkpoint1_reached = player.on_platform == self.show_checkpoint1_reached
+
+        if player.on_platform == self.brighten_scene and not self.scene_brightened:
+            self.scene.flashlight.enabled = False
+            self.scene_brightened = True
+
+        if player.on_platform == self.show_checkpoint2_reached and not self.flashlight_broken:
+            self.scene.show_popup("flashlight_broken")
+            self.scene.plugin(FlashlightPlugin).replace(intensity=60)
+            self.flashlight_broken = True
+
+    def draw_hud(self, screen):
+        if self.blit_show_slide:
+            text = render_text('fonts/MajorMonoDisplay-Regular.ttf', 60, "← slide...", self.scene.text_color)
+        elif self.blit_show_slide2:
+            text = render_text('fonts/MajorMonoDisplay-Regular.ttf', 60, "slide... →", self.scene.text_color)
+        elif self.blit_checkpoint1_reached:
+            text = render_text('fonts/MajorMonoDisplay-Regular.ttf', 30, "checkpoint1 reached", self.scene.text_color)
+        else:
+            return
+        screen.blit(text, text.get_rect(center=(500, 350)))
+
+def terus1Plugins():
+    return [Terus1Level(), FlashlightPlugin(intensity=100)]
+
+class Scopulosus53Level(LevelPlugin):
+    volcano_introduction = ["introduce_volcanoes1", "introduce_volcanoes2", "introduce_volcanoes3"]
+    def setup(self):
+        self.introduce_volcano = self.scene.platform_named("introduce-volcano")
+        self.introduce_deathcano = self.scene.platform_named("jump-platform4")
+        self.one_way = self.scene.platform_named("checkpoint3")
+        self.volcano_introduction_sequence, self.volcano_tips_sequence, self.near_end = False, False, False
+
+    def player(self, player):
+        if player.on_platform == self.introduce_volcano and not self.volcano_introduction_sequence:
+            self.scene.start_popup_sequence(self.volcano_introduction)
+            self.volcano_introduction_sequence = True
+
+        if player.on_platform == self.introduce_deathcano and not self.volcano_tips_sequence:
+            self.scene.show_popup("volcano_tip1")
+            self.volcano_tips_sequence = True
+
+        if player.on_platform == self.one_way and not self.near_end:
+            self.scene.show_popup("one_way_home")
+            self.near_end = True
+
+def scopulosus53Plugins():
+    return [Scopulosus53Level()]
+
+class Magnus25Level(LevelPlugin):
+    intro_popups = ["popup1", "popup2", "popup3"]
+    def setup(self):
+        self.scene.start_popup_sequence(self.intro_popups)
+        self.introduce_bunker = self.scene.platform_named("homeless-shelter1")
+        self.introduce_hook = self.scene.platform_named("base-platform13")
+        self.introduced_bunker = False
+        self.introduced_hook = False
+
+    def player(self, player):
+        if player.on_platform == self.introduce_bunker and not self.introduced_bunker:
+            self.scene.show_popup("bunkerintro")
+            self.introduced_bunker = True
+
+        elif player.on_platform == self.introduce_hook and not self.introduced_hook:
+            self.scene.show_popup("hookIntro")
+            self.introduced_hook = True
+
+def magnus25Plugins():
+    return [Magnus25Level(), StormPlugin(trigger_distance=150)]
+
+class TrainingLevel(LevelPlugin):
+    initial_popups = ["welcome", "purpose", "get_started"]
+    def setup(self):
+        self.scene.start_popup_sequence(self.initial_popups)
+        self.intro_to_jumping = self.scene.platform_named("introduce-jumping")
+        self.intro_to_sliding = self.scene.platform_named("introduce-sliding")
+        self.intro_to_jumpslide = self.scene.platform_named("introduce-jumpsliding")
+        self.blit_jumpslide = False
+        self.lock_controls()
+
+    def lock_controls(self):
+        """Takes jumping and sliding away until the players reach the platforms that introduce them."""
+        for player in self.scene.active_players:
+            player.can_jump, player.can_slide = False, False
+        self.scene.introduced_controls_state["introduced_jumping"], self.scene.introduced_controls_state["introduced_sliding"] = False, False
+
+    def frame(self):
+        update_tutorial_controls(self.scene.active_players, self.intro_to_jumping, self.intro_to_sliding, self.scene.introduced_controls_state)
+
+    def player(self, player):
+        self.blit_jumpslide = player.on_platform == self.intro_to_jumpslide
+
+    def finished(self):
+        self.lock_controls()
+
+    def players_changed(self):
+        self.lock_controls()
+
+    def draw_hud(self, screen):
+        scene = self.scene
+        display_controls(len(scene.active_players), scene.introduced_controls_state, scene.print_controls)
+        introduce_controls(self.blit_jumpslide)
+
+def trainingPlugins():
+    return [TrainingLevel()]
 
 def mainTextInit(font, lil_font, text_color, window_size):
     # Create a surface to hold all the text and background elements
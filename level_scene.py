@@ -0,0 +1,622 @@
+"""The level runner. Every level is a LevelScene (the shared loop: input, checkpoints, artifacts, entities, fixed-step
+physics, rendering, HUD and menus) plus a list of plugins that add what makes the level different. Ladders, hooks,
+volcanoes and popups are declared in the level json (see level_entities.py). Feature plugins (flashlight, storm) live
+here, level-specific plugins (triggers, tutorials) live in level_init.py."""
+
+import json
+import time
+import random
+import pygame
+from Levels.Terus1.flashlight import Flashlight
+from Players.player import Player
+from camera import Camera
+from popups import Popup
+from Buttons.buttons import Button, ButtonGroup
+from level_entities import load_entities, load_popup_data
+from level_bundle import get_compiled_level
+from region_streamer import RegionStreamer
+from level_snapshot import LevelSnapshot
+from splitscreen import SplitscreenCompositor
+from frame_scheduler import scheduler
+from frame_profiler import profiler
+from presentation import get_events
+from font_registry import get_font
+from asset_cache import load_image
+from game_clock import default_clock
+from simulation import reload_map, update_game_logic
+from menus import settings_menu, pause_menu, level_completed
+from game_init import (
+    window_size,
+    artifacts_at,
+    render_artifact_count,
+    determine_blitted_controls,
+    update_timer,
+    render_timer,
+    renderSplitscreenLayout,
+    get_static_layer,
+)
+
+WEB_ENVIRONMENT = False
+try:
+    import pygbag.fs # type: ignore
+    WEB_ENVIRONMENT = True
+except ImportError:
+    pass  # We're not running in a web environment
+
+def read_json_file(filepath):
+    if WEB_ENVIRONMENT:
+        # Load file using pygbag.fs in a web environment
+        with pygbag.fs.open(filepath, 'r') as key_map:
+            return json.load(key_map)
+    else:
+        # Load file normally in a local environment
+        with open(filepath, 'r') as key_map:
+            keys_data = json.load(key_map)
+    return keys_data
+
+async def load_json_file(filepath):
+    return read_json_file(filepath)
+
+_controls_data = None
+
+async def load_controls():
+    """Returns Players/player_controls.json, parsed the first time it's needed."""
+    global _controls_data
+    if _controls_data is None:
+        _controls_data = await load_json_file('Players/player_controls.json')
+    return _controls_data
+
+async def load_level(level_name, num_of_players, level=None):
+
+    keys_data = await load_controls()
+
+    if level is None:
+        level = get_compiled_level(level_name, read_json_file)
+    bg_image = load_image(f'Levels/{level_name}/assets/bg_image.png', window_size)  # Usually preloaded in a menu, see asset_manager
+
+    player_controls = keys_data['controls']['players']
+    player_colors = keys_data['colors']['players']
+
+    level_type = level.level_type
+    platforms = level.build_platforms()
+
+    OG_spawn_point, death_platforms, next_checkpoints, finish_line = level.special_platforms(platforms)
+    get_static_layer(platforms, death_platforms)  # Sort static platforms into render chunks while the loading screen is up
+
+    # Every player declared in player_controls.json can join, in the order they are numbered
+    active_players = []
+
+    for number in range(min(num_of_players, len(player_controls))):
+        player = f'player{number + 1}'
+        active_players.append(Player(player_id=number + 1, position=OG_spawn_point, controls=player_controls[player], color=player_colors[player]))
+    
+    spawn_point = OG_spawn_point
+    checkpoint_increment = 0
+    reset_positions = []
+
+    print_controls = determine_blitted_controls(keys_data['show_controls']['players'], player_colors)
+
+    for player in active_players:
+        reset_positions.append(spawn_point)
+
+    introduced_controls_state = {"introduced_jumping": True, "introduced_sliding": True}
+
+    if level_type == 'scrolling':
+        
+        level_width, level_height = level.camera_dimensions[0], level.camera_dimensions[1]
+        camera = Camera(width=level_width, height=level_height, window_size=window_size, zoom=1.0)
+        camera.is_active = True
+        next_checkpoint = next_checkpoints[checkpoint_increment]
+
+    else:
+        level_width, level_height = 1000, 700
+        camera = Camera(width=level_width, height=level_height, window_size=window_size, zoom=1.0)
+        camera.is_active = False
+        introduced_controls_state["introduced_jumping"], introduced_controls_state['introduced_sliding'] = True, True
+        next_checkpoint = None
+        checkpoint_increment = None
+
+    return bg_image, checkpoint_increment, reset_positions, spawn_point, platforms, camera, active_players, introduced_controls_state, level_height, OG_spawn_point, death_platforms, next_checkpoints, finish_line, print_controls, next_checkpoint
+
+async def newPlayerCount(new_num_of_players ,active_players, level_name):
+    if len(active_players) != new_num_of_players:
+        num_of_players = new_num_of_players
+        bg_image, checkpoint_increment, reset_positions, spawn_point, platforms, camera, active_players, introduced_controls_state, level_height, OG_spawn_point, death_platforms, next_checkpoints, finish_line, print_controls, next_checkpoint = await load_level(level_name, num_of_players)
+    return active_players
+
+
+class LevelPlugin:
+    popup_data = []  # Popups the plugin adds on top of the ones in the level json (dicts with name, text, button_text and visible)
+
+    def __init__(self):
+        """
+        Base class for the behaviour a level adds on top of LevelScene. Every hook does nothing by default, override the
+        ones you need. The scene sets self.scene before setup() is called.
+
+        Hooks are called in this order every frame: frame(), player(player) for each player, event(event) for each event,
+        step(fixed_delta_time) for each fixed physics step, then draw_hud(screen) once the world has been drawn.
+        """
+        self.scene = None
+
+    def setup(self):
+        """Called once the level is loaded (build entities and reset state here)."""
+
+    def snapshot(self, snapshot):
+        """Called once after setup(): add the objects the plugin changes while the level is played to the LevelSnapshot."""
+
+    def restart(self):
+        """Called on restart, after the level snapshot was restored. Runs setup() again unless overridden."""
+        self.setup()
+
+    def frame(self):
+        """Called at the start of every frame, before the per-player rules."""
+
+    def player(self, player):
+        """Called for every active player, every frame."""
+
+    def event(self, event):
+        """Called for every pygame event (check self.scene.popup_active before reacting to controls)."""
+
+    def step(self, fixed_delta_time):
+        """Called after update_game_logic on every fixed physics step."""
+
+    def draw_hud(self, screen):
+        """Draws on top of the world, under the timer, popups and buttons."""
+
+    def finished(self):
+        """Called when a player reaches the finish line."""
+
+    def reload(self):
+        """Called when the players respawn at the last checkpoint (R or the reload button)."""
+
+    def players_changed(self):
+        """Called after the number of players was changed in the settings menu."""
+
+class FlashlightPlugin(LevelPlugin):
+
+    def __init__(self, intensity=100):
+        """
+        Gives the level a flashlight that follows the last player: platforms without images are drawn black while it is
+        enabled, and F toggles the beam.
+
+        Args:
+            intensity (int): Brightness of the beam when the level starts.
+        """
+        super().__init__()
+        self.intensity = intensity
+
+    def setup(self):
+        self.scene.flashlight = Flashlight(self.scene.screen, intensity=self.intensity)
+        self.scene.flashlight.enabled = True
+        self.initial_flashlight = self.scene.flashlight
+
+    def snapshot(self, snapshot):
+        snapshot.add([self.initial_flashlight])
+
+    def restart(self):
+        # replace() may have swapped in a dimmer flashlight, the snapshot has already put the first one back in its state
+        self.scene.flashlight = self.initial_flashlight
+
+    def replace(self, intensity):
+        """Swaps in a flashlight with a different intensity (keeps it enabled)."""
+        self.scene.flashlight = Flashlight(self.scene.screen, intensity=intensity)
+        self.scene.flashlight.enabled = True
+
+    def player(self, player):
+        self.scene.flashlight.flipped = player.facing == -1
+
+    def event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_f and not self.scene.popup_active:
+            self.scene.flashlight.on = not self.scene.flashlight.on
+
+    def step(self, fixed_delta_time):
+        self.scene.flashlight.pos = pygame.Vector2(self.scene.active_players[-1].rect.center)
+
+    def reload(self):
+        self.scene.flashlight.enabled = True
+
+class StormPlugin(LevelPlugin):
+
+    def __init__(self, trigger_distance=150):
+        """
+        Adds sandstorms that send players back to their checkpoint unless they shelter on the homeless-shelter{num} platforms.
+
+        Args:
+            trigger_distance (float): How close to a shelter a player has to get for the storm warning to start.
+        """
+        super().__init__()
+        self.trigger_distance = trigger_distance
+        self.storm = None
+
+    def setup(self):
+        from Levels.Magnus25.storm import Storm
+        self.storm = Storm(trigger_distance=self.trigger_distance, platforms=self.scene.numbered_platforms("homeless-shelter"), font=None, screen_size=window_size)
+
+    def snapshot(self, snapshot):
+        snapshot.add([self.storm])
+
+    def restart(self):
+        # A new Storm would draw its first duration now, after the restart reseeded random, so replays of the new take match
+        self.storm.storm_duration = random.uniform(3, 5)
+
+    def player(self, player):
+        self.storm.update(player, self.scene.spawn_point, current_time=default_clock.now())
+
+    def draw_hud(self, screen):
+        self.storm.draw(screen)
+
+class LevelScene:
+    # Zooms the - and = keys step through. The streamer's view stays at zoom 1, which still covers a viewport at 0.5
+    ZOOM_LEVELS = (1.0, 0.75, 0.5)
+
+    def __init__(self, level_name, screen, canvas, active_players, input_session, text_color, plugins=(), briefing_key=None, briefing_text="", timer_font=('fonts/MajorMonoDisplay-Regular.ttf', 30), kill_above=None):
+        """
+        Runs a level: loads it, then loops over input, level rules, fixed-step physics, rendering and menus until the
+        player leaves. Everything level-specific comes from plugins.
+
+        Args:
+            level_name (str): Name of the level folder and json file (ex: 'Magnus25').
+            screen (pygame.Surface): Display surface.
+            canvas (pygame.Surface): Off-screen surface the split-screen viewports are drawn on.
+            active_players (list): Players when the level is opened (only their count is used, the level builds its own).
+            input_session (InputSession): Records or replays the input of every fixed step.
+            text_color (str): Theme color of the level's popups and menus.
+            plugins (list): LevelPlugin objects, called in this order.
+            briefing_key (str): Key in Levels/<level_name>/artifact_info.json whose after-level-info is shown after finishing.
+            briefing_text (str): Text shown after finishing when there is no briefing_key.
+            timer_font (tuple): (font file, size) of the level timer.
+            kill_above (float): Respawn players that go above this y (None to let them go as high as they want).
+        """
+        self.level_name = level_name
+        self.screen = screen
+        self.canvas = canvas
+        self.active_players = active_players
+        self.num_of_players = len(active_players)
+        self.input_session = input_session
+        self.text_color = text_color
+        self.plugins = list(plugins)
+        self.briefing_key = briefing_key
+        self.briefing_text = briefing_text
+        self.timer_font = timer_font
+        self.kill_above = kill_above
+        self.fixed_delta_time = scheduler.fixed_delta_time
+
+        self.flashlight = Flashlight(screen, intensity=100)
+        self.volcanoes = []
+        self.ladders = []
+        self.hooks = []
+        self.popups = []
+        self.popups_by_name = {}
+        self.popup_active = False
+        self.reload_requested = False
+        self.popup_sequence = []
+        self.popup_sequence_index = 0
+        self.counting_string = "00:00:00"
+
+        self.buttons = ButtonGroup([
+            Button(image=load_image("Buttons/reload_button.png"), pos=(85, 43), text_input=None, font=get_font('fonts/MajorMonoDisplay-Regular.ttf', 40), base_color="#167fc9", hovering_color="#F59071"),
+            Button(image=load_image("Buttons/pause_button.png"), pos=(30, 35), text_input=None, font=get_font('fonts/MajorMonoDisplay-Regular.ttf', 40), base_color=("White"), hovering_color=("White"))
+        ])
+        self.reload_button, self.pause_button = self.buttons
+
+        for plugin in self.plugins:
+            plugin.scene = self
+
+    def plugin(self, plugin_type):
+        """Returns the scene's plugin of the given class (or None)."""
+        return next((plugin for plugin in self.plugins if isinstance(plugin, plugin_type)), None)
+
+    def platform_named(self, name):
+        return self.platforms_by_name.get(name)
+
+    def numbered_platforms(self, prefix):
+        """Returns the platforms named prefix1, prefix2... in order, stopping at the first missing number."""
+        numbered = []
+        while f"{prefix}{len(numbered) + 1}" in self.platforms_by_name:
+            numbered.append(self.platforms_by_name[f"{prefix}{len(numbered) + 1}"])
+        return numbered
+
+    def show_popup(self, name):
+        popup = self.popups_by_name.get(name)
+        if popup:
+            popup.visible = True
+
+    def start_popup_sequence(self, names):
+        """Shows the first popup of names, each following one is shown once the previous one is closed."""
+        self.popup_sequence = list(names)
+        self.popup_sequence_index = 0
+        self.show_popup(self.popup_sequence[0])
+
+    def _advance_popup_sequence(self):
+        if self.popup_sequence and self.popup_sequence_index + 1 < len(self.popup_sequence):
+            if not self.popups_by_name[self.popup_sequence[self.popup_sequence_index]].visible:
+                self.popup_sequence_index += 1
+                self.show_popup(self.popup_sequence[self.popup_sequence_index])
+
+    def show_loading(self):
+        self.screen.fill("#020626")
+        loading_text = get_font('fonts/MajorMonoDisplay-Regular.ttf', 40).render("loading...", True, ("#71d6f5"))
+        self.screen.blit(loading_text, loading_text.get_rect(center=(window_size[0] // 2, window_size[1] // 2)))
+        pygame.display.update()
+
+    async def load(self):
+        """Loads the level, lets every plugin set itself up and takes the snapshot restarts go back to."""
+        default_clock.reset()  # Levels run from 0 like a headless World, so recordings replay the same volcano and storm timings
+        self.level = get_compiled_level(self.level_name, read_json_file)
+        self.bg_image, self.checkpoint_increment, self.reset_positions, self.spawn_point, self.platforms, self.camera, self.active_players, self.introduced_controls_state, self.level_height, self.OG_spawn_point, self.death_platforms, self.next_checkpoints, self.finish_line, self.print_controls, self.next_checkpoint = await load_level(self.level_name, self.num_of_players, self.level)
+        self.platforms_by_name = {platform.name: platform for platform in self.platforms}
+        self.level_data = {self.level_name: self.level.data}
+        entities = load_entities(self.level_data, self.level_name, screen=self.screen)
+        self.ladders = entities.get("ladders", [])
+        self.hooks = entities.get("hooks", [])
+        self.volcanoes = entities.get("volcanoes", [])
+        self.compositor = SplitscreenCompositor(self.canvas, self.camera.width, self.camera.height, zoom=self.camera.zoom)
+        self.streamer = RegionStreamer(view_size=(window_size[0] / self.camera.zoom, window_size[1] / self.camera.zoom), region_size=get_static_layer(self.platforms, self.death_platforms).chunk_size)
+        self.artifacts = artifacts_at(self.level.artifact_anchors, self.level_name)
+        self.artifacts_collected = 0
+        self.collected_artifacts = []
+        self.level_complete = False
+        self.paused = False
+        self.editing_settings = False
+        self.popup_sequence = []
+        self.popup_sequence_index = 0
+
+        popup_data = load_popup_data(self.level_data, self.level_name) + [data for plugin in self.plugins for data in plugin.popup_data]
+        self.popups = [Popup(data["name"], self.screen, data["text"], self.text_color, data["button_text"], data["visible"]) for data in popup_data]
+        self.popups_by_name = {popup.name: popup for popup in self.popups}
+
+        for plugin in self.plugins:
+            plugin.setup()
+
+        self.snapshot = self.take_snapshot()
+        self.start_timer = default_clock.ticks()
+
+    def take_snapshot(self):
+        """Captures everything that changes while the level is played (see level_snapshot.py)."""
+        snapshot = LevelSnapshot()
+        snapshot.add(self.active_players)
+        snapshot.add(self.platforms, fields=("position", "direction", "previous_direction", "velocity", "current_frame", "color"))
+        snapshot.add(self.artifacts, fields=("collected",))
+        snapshot.add(self.ladders, fields=("on_ladder",))
+        snapshot.add(self.hooks)
+        snapshot.add(self.volcanoes)
+        snapshot.add(self.popups, fields=("visible",))
+        snapshot.add([self], fields=("spawn_point", "checkpoint_increment", "next_checkpoint", "introduced_controls_state", "artifacts_collected", "collected_artifacts", "level_complete", "popup_sequence", "popup_sequence_index"))
+
+        for plugin in self.plugins:
+            plugin.snapshot(snapshot)
+        return snapshot
+
+    async def restart(self):
+        """Puts the level back the way it was loaded, from the snapshot instead of loading it again."""
+        self.input_session.restart()
+        default_clock.reset()
+        self.snapshot.restore()
+        self.platforms.refresh()
+        if self.hooks:
+            self.hooks.refresh()
+        self.paused = False
+        self.editing_settings = False
+        self.reload_requested = False
+
+        for plugin in self.plugins:
+            plugin.restart()
+
+        self.start_timer = default_clock.ticks()
+
+    def reload(self):
+        """Respawns the players at the last checkpoint (the timer restarts if there is no checkpoint yet)."""
+        reload_map(self.active_players, self.platforms, self.spawn_point, self.artifacts)
+        self.level_complete = False
+        for plugin in self.plugins:
+            plugin.reload()
+        if self.spawn_point == self.OG_spawn_point or not self.next_checkpoints:
+            self.start_timer = default_clock.ticks()
+
+    def zoom(self, direction):
+        """Zooms every viewport one step out of ZOOM_LEVELS (direction 1) or back in (direction -1), only the drawing changes."""
+        levels = self.ZOOM_LEVELS
+        current = min(range(len(levels)), key=lambda index: abs(levels[index] - self.compositor.zoom))
+        self.compositor.set_zoom(levels[max(0, min(current + direction, len(levels) - 1))])
+
+    def player_rules(self, player):
+        """Rules every level shares: volcanoes, falling out, death platforms, checkpoints, the finish line and artifact pickup."""
+        for volcano in self.volcanoes:
+            volcano.interact_with_player(player, self.volcanoes)
+
+        if player.position.y > self.level_height + 100 or (self.kill_above is not None and player.position.y < self.kill_above):
+            player.reload(self.spawn_point)
+
+        if player.on_platform == self.finish_line:
+            self.level_complete = True
+            self.checkpoint_increment = 0
+            self.spawn_point = self.OG_spawn_point
+
+            for platform in self.next_checkpoints:
+                platform.color = "#9ff084"
+            for plugin in self.plugins:
+                plugin.finished()
+
+        if player.on_platform in self.death_platforms:
+            player.reload(self.spawn_point)
+
+        next_checkpoint = self.next_checkpoint
+        if next_checkpoint is not None and player.on_platform == next_checkpoint:
+            self.spawn_point = (next_checkpoint.position.x + (next_checkpoint.dimensions[0] / 2), next_checkpoint.start_position.y - next_checkpoint.dimensions[1])
+            next_checkpoint.color = "#228700"
+
+            if self.checkpoint_increment < len(self.next_checkpoints) - 1:
+                self.checkpoint_increment += 1
+                self.next_checkpoint = self.next_checkpoints[self.checkpoint_increment]
+
+        for artifact in self.artifacts:
+            if player.rect.colliderect(artifact.rect) and not artifact.collected and artifact not in self.collected_artifacts:
+                artifact.collect()
+                self.artifacts_collected += 1
+                self.collected_artifacts.append(artifact)
+
+    def handle_event(self, event, mouse_position):
+        for popup in self.popups:
+            popup.handle_event(event)
+
+        if event.type == pygame.QUIT:
+            pygame.quit()
+            exit()
+
+        elif event.type == pygame.MOUSEBUTTONDOWN and not self.popup_active:
+            if self.reload_button.checkForInput(mouse_position):
+                self.reload_requested = True
+
+            if self.pause_button.checkForInput(mouse_position):
+                self.time_paused = time.time()
+                self.paused = True
+
+        elif event.type == pygame.KEYDOWN and not self.popup_active:
+            if event.key == pygame.K_r:
+                self.reload_requested = True
+
+            if event.key == pygame.K_p:
+                self.time_paused = time.time()
+                self.paused = True
+
+            if event.key == pygame.K_MINUS:
+                self.zoom(1)
+            elif event.key == pygame.K_EQUALS:
+                self.zoom(-1)
+
+        for plugin in self.plugins:
+            plugin.event(event)
+
+    async def briefing(self):
+        if self.briefing_key is None:
+            return self.briefing_text
+        artifact_info = await load_json_file(f"Levels/{self.level_name}/artifact_info.json")
+        return artifact_info[self.briefing_key]["after-level-info"]
+
+    async def menus(self):
+        """
+        Runs the pause, settings or level complete menu if one is open. Returns "go to home" or "go to level select" if
+        the player chose to leave the level, otherwise None.
+        """
+        if self.paused:
+            action = await pause_menu(self.screen, self.level_name, window_size, self.time_paused)
+            self.paused = False
+
+            if action == "level restart":
+                await self.restart()
+            elif action == "go to settings" and not self.editing_settings:
+                self.time_entered_settings = time.time()
+                self.editing_settings = True
+            elif action in ("go to home", "go to level select"):
+                return action
+
+        elif self.editing_settings:
+            settings_action = await settings_menu(self.screen, window_size, self.time_entered_settings)
+            if isinstance(settings_action, int):
+                previous_players = self.active_players
+                self.active_players = await newPlayerCount(settings_action, self.active_players, self.level_name)
+                if self.active_players is not previous_players:
+                    self.snapshot.replace(previous_players, self.active_players)
+                self.num_of_players = len(self.active_players)
+                for plugin in self.plugins:
+                    plugin.players_changed()
+            self.editing_settings = False
+
+        elif self.level_complete:
+            action = await level_completed(self.screen, self.level_name, self.text_color, window_size, await self.briefing(), time_finished=time.time(), total_time=self.counting_string)
+            if action == "level restart":
+                await self.restart()
+            elif action in ("go to home", "go to level select"):
+                return action
+
+        return None
+
+    def update(self, keys):
+        """Respawns the players if they asked to, then runs this frame's fixed physics steps."""
+        # Respawns go through the input session so they are recorded, and replays ignore live R presses and reload clicks
+        steps, keys, popup_active, reload = self.input_session.frame(keys, self.popup_active, scheduler.take_steps(), self.num_of_players, self.reload_requested)
+        self.reload_requested = False
+        if reload:
+            self.reload()
+
+        for _ in range(steps):
+            update_game_logic(self.fixed_delta_time, self.active_players, self.platforms, keys, self.spawn_point, popup_active, ladders=self.ladders, hooks=self.hooks)
+            for hook in self.hooks:
+                hook.update(self.fixed_delta_time)
+            if self.hooks:
+                self.hooks.refresh()
+            # Stepped with the physics like in World.physics_step, not per rendered frame, so replays get the same timings
+            for volcano in self.volcanoes:
+                volcano.update()
+            for plugin in self.plugins:
+                plugin.step(self.fixed_delta_time)
+
+    def draw(self):
+        self.canvas.fill((0, 0, 0))
+        renderSplitscreenLayout(self.compositor, self.active_players, self.bg_image, self.platforms, self.death_platforms, self.artifacts, self.collected_artifacts, self.flashlight, self.volcanoes, ladders=self.ladders, hooks=self.hooks)
+
+        for plugin in self.plugins:
+            plugin.draw_hud(self.screen)
+
+        self.counting_string = update_timer(self.start_timer)
+        render_artifact_count(("#56911f"), self.artifacts_collected)
+        render_timer(self.timer_font[0], self.timer_font[1], "#32854b", self.counting_string)
+
+        for popup in self.popups:
+            popup.update()
+
+        self.buttons.hover(pygame.mouse.get_pos())
+        self.buttons.draw(self.screen)
+
+    async def run(self):
+        """
+        Plays the level until the player leaves it. Returns False if they went to the home screen, None if they went
+        back to level select.
+        """
+        self.show_loading()
+        await self.load()
+        scheduler.reset()
+
+        while True:
+            profiler.begin_frame()
+            scheduler.begin_frame()
+            keys = pygame.key.get_pressed()
+            mouse_position = pygame.mouse.get_pos()
+            self.popup_active = any(popup.visible for popup in self.popups)
+            self._advance_popup_sequence()
+
+            self.streamer.update(self.active_players, get_static_layer(self.platforms, self.death_platforms), [self.volcanoes], self.flashlight.enabled)
+
+            for plugin in self.plugins:
+                plugin.frame()
+
+            for player in self.active_players:
+                for plugin in self.plugins:
+                    plugin.player(player)
+                self.player_rules(player)
+
+            for event in get_events():
+                self.handle_event(event, mouse_position)
+
+            if self.paused or self.editing_settings or self.level_complete:
+                action = await self.menus()
+                if action == "go to home":
+                    return False
+                elif action == "go to level select":
+                    return None
+
+            else:
+                profiler.mark("input")
+                self.update(keys)
+                profiler.mark("physics")
+                self.draw()
+
+                profiler.mark("hud")
+                profiler.draw(self.screen)
+                profiler.skip()
+
+                pygame.display.flip()
+                profiler.mark("flip")
+                profiler.end_frame()
+
+            await scheduler.end_frame()
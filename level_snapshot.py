@@ -0,0 +1,70 @@
+"""Level snapshots. A LevelSnapshot remembers the mutable state of a level's objects right after it is loaded (player
+positions and abilities, moving platforms, checkpoint colors, collected artifacts, hooks, storms...), so restarting a
+level puts the same objects back in place instead of loading everything again."""
+
+import pygame
+from level_entities import LazyEntities
+
+def capture_state(obj, fields=None):
+    """
+    Returns a copy of an object's attributes (vectors, rects, lists and dicts are copied, everything else is shared).
+
+    Args:
+        obj: Object to capture, with a __dict__ or __slots__.
+        fields (tuple): Attributes to capture (default: all of them).
+    """
+    if fields is None:
+        fields = obj.__slots__ if hasattr(obj, '__slots__') else list(vars(obj))
+    return {name: _copy(getattr(obj, name)) for name in fields if hasattr(obj, name)}
+
+def restore_state(obj, state):
+    """Puts captured attributes back (copied again, so the snapshot can be restored any number of times)."""
+    for name, value in state.items():
+        setattr(obj, name, _copy(value))
+
+def _copy(value):
+    if isinstance(value, (pygame.Vector2, pygame.Rect)):
+        return value.copy()
+    elif isinstance(value, list):
+        return list(value)
+    elif isinstance(value, dict):
+        return dict(value)
+    return value
+
+class LevelSnapshot:
+    def __init__(self):
+        """
+        State of a set of objects at one point in time. Add objects with add(), then restore() puts every one of them
+        back the way it was when it was added.
+        """
+        self.states = []
+        self.lazy = []
+
+    def add(self, objects, fields=None):
+        """
+        Captures objects. LazyEntities aren't captured: restoring drops everything they built, so it is built again
+        from scratch when a player gets near.
+
+        Args:
+            objects (iterable): Objects to capture (players, platforms, hooks...).
+            fields (tuple): Only capture these attributes (ex: ("collected",) for artifacts, which are sprites).
+        """
+        if isinstance(objects, LazyEntities):
+            self.lazy.append(objects)
+            return
+
+        for obj in objects:
+            self.states.append((obj, capture_state(obj, fields)))
+
+    def replace(self, old_objects, new_objects, fields=None):
+        """Forgets old_objects and captures new_objects instead (ex: after the number of players changed)."""
+        old_ids = {id(obj) for obj in old_objects}
+        self.states = [(obj, state) for obj, state in self.states if id(obj) not in old_ids]
+        self.add(new_objects, fields)
+
+    def restore(self):
+        for obj, state in self.states:
+            restore_state(obj, state)
+
+        for entities in self.lazy:
+            entities.release([])
@@ -0,0 +1,255 @@
+"""Menus drawn on top of a frozen frame of the game (settings, pause, level complete). Each one returns what the player
+picked and leaves it to the caller (a LevelScene or the home screen) to act on it."""
+
+import time
+import pygame
+from popups import Popup
+from Buttons.buttons import Button, ButtonGroup
+from presentation import Presenter, changes_screen
+from backdrop import Backdrop
+from font_registry import get_font
+from asset_cache import load_image
+
+MAX_PLAYERS = 8  # Players declared in Players/player_controls.json
+
+async def settings_menu(screen, window_size, time_entered_settings):
+
+    backdrop = Backdrop(screen, max_blur_radius=6, blur_duration=0)
+
+    font = get_font('fonts/MajorMonoDisplay-Regular.ttf', 55)
+    lil_font = get_font('fonts/pixelated.ttf', 35)
+    button_image = load_image("Buttons/tutorial_button.png")
+    small_button = load_image("Buttons/lilbutton.png")
+
+    EXIT_SETTINGS = Button(image=button_image, pos=(500, 500), text_input="Exit", font=get_font('fonts/pixelated.ttf', 40), base_color="#167fc9", hovering_color="#F59071")
+    # 1p-4p on the first row, 5p-8p under it
+    PLAYER_BUTTONS = [
+        Button(image=small_button, pos=(470 + (count - 1) % 4 * 80, 250 + (count - 1) // 4 * 70), text_input=f"{count}p", font=get_font('fonts/pixelated.ttf', 25), base_color="#167fc9", hovering_color="#F59071")
+        for count in range(1, MAX_PLAYERS + 1)
+    ]
+
+    buttons = ButtonGroup([EXIT_SETTINGS] + PLAYER_BUTTONS)
+
+    printsettings = font.render("settings", True, ("#71d6f5"))
+    print_player_num = lil_font.render("# of players:", True, ("#71d6f5"))
+    text_rect1 = printsettings.get_rect(center=(window_size[0] // 2, window_size[1] // 2 - 200))
+    text_rect2 = print_player_num.get_rect(center=(260, 250))
+    presenter = Presenter(screen)
+
+    while True:
+
+        MENU_MOUSE_POS = pygame.mouse.get_pos()
+        settings_time_elapsed = time.time() - time_entered_settings
+        redraw = presenter.full or not backdrop.done(settings_time_elapsed)
+
+        for event in presenter.events():
+            redraw = redraw or changes_screen(event)
+            
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                exit()
+
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    return False
+
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                
+                if EXIT_SETTINGS.checkForInput(MENU_MOUSE_POS):
+                    return False
+                
+                for count, player_button in enumerate(PLAYER_BUTTONS, start=1):
+                    if player_button.checkForInput(MENU_MOUSE_POS):
+                        return count
+        
+        hovered = buttons.hover(MENU_MOUSE_POS)
+
+        if redraw:
+            screen.blit(backdrop.get(settings_time_elapsed), (0, 0))
+
+            if backdrop.done(settings_time_elapsed):
+                screen.blit(printsettings, text_rect1)
+                screen.blit(print_player_num, text_rect2)
+                buttons.draw(screen)
+
+            presenter.invalidate()
+
+        elif hovered:
+            # Only the buttons whose hover state changed are redrawn and sent to the display
+            for rect in hovered:
+                screen.blit(backdrop.get(settings_time_elapsed), rect, rect)
+            buttons.draw(screen)
+            presenter.invalidate_all(hovered)
+
+        presenter.present()
+        await presenter.idle(animating=not backdrop.done(settings_time_elapsed))
+
+async def pause_menu(screen, level_name, window_size, time_paused):
+
+    backdrop = Backdrop(screen, max_blur_radius=10, blur_duration=0)
+
+    font = get_font('fonts/MajorMonoDisplay-Regular.ttf', 55)
+    button_image = load_image("Buttons/tutorial_button.png")
+
+    printtext = font.render("Paused", True, ("#71d6f5"))
+    text_rect = printtext.get_rect(center=(window_size[0] // 2, window_size[1] // 2 - 200))
+
+    RESUME_BUTTON = Button(image=button_image, pos=(500, 260), text_input="Resume", font=get_font('fonts/pixelated.ttf', 40), base_color="#167fc9", hovering_color="#F59071")
+    RESTART_LEVEL = Button(image=button_image, pos=(500, 330), text_input="Restart", font=get_font('fonts/pixelated.ttf', 40), base_color="#167fc9", hovering_color="#F59071")
+
+    if level_name in ["Home", "Training"]:
+        
+        SETTINGS = Button(image=button_image, pos=(500, 400), text_input="Settings", font=get_font('fonts/pixelated.ttf', 40), base_color="#167fc9", hovering_color="#F59071")
+        MAIN_MENU = Button(image=button_image, pos=(500, 470), text_input="Home", font=get_font('fonts/pixelated.ttf', 40), base_color="#167fc9", hovering_color="#F59071")
+        buttons = ButtonGroup([RESUME_BUTTON, RESTART_LEVEL, SETTINGS, MAIN_MENU])
+    
+    else:
+
+        SETTINGS = Button(image=button_image, pos=(500, 400), text_input="Settings", font=get_font('fonts/pixelated.ttf', 40), base_color="#167fc9", hovering_color="#F59071")
+        MAIN_MENU = Button(image=button_image, pos=(500, 540), text_input="Home", font=get_font('fonts/pixelated.ttf', 40), base_color="#167fc9", hovering_color="#F59071")
+        LEVEL_SELECTION = Button(image=button_image, pos=(500, 470), text_input="Level select", font=get_font('fonts/pixelated.ttf', 30), base_color="#167fc9", hovering_color="#F59071")
+        buttons = ButtonGroup([RESUME_BUTTON, RESTART_LEVEL, SETTINGS, LEVEL_SELECTION, MAIN_MENU])
+
+    presenter = Presenter(screen)
+
+    while True:
+        
+        MENU_MOUSE_POS = pygame.mouse.get_pos()
+        paused_time_elapsed = time.time() - time_paused
+        redraw = presenter.full or not backdrop.done(paused_time_elapsed)
+        
+        for event in presenter.events():
+            redraw = redraw or changes_screen(event)
+            
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                exit()
+
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                
+                if RESUME_BUTTON.checkForInput(MENU_MOUSE_POS):
+                    return False
+                
+                elif RESTART_LEVEL.checkForInput(MENU_MOUSE_POS):
+                    return "level restart"
+
+                elif SETTINGS.checkForInput(MENU_MOUSE_POS):
+                    return "go to settings"
+                
+                elif MAIN_MENU.checkForInput(MENU_MOUSE_POS):
+                    return "go to home"
+
+                if level_name not in ["Home", "Training"]:
+
+                    if LEVEL_SELECTION.checkForInput(MENU_MOUSE_POS):
+                        return "go to level select"
+
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    return False
+
+        hovered = buttons.hover(MENU_MOUSE_POS)
+
+        if redraw:
+            screen.blit(backdrop.get(paused_time_elapsed), (0, 0))
+            
+            if backdrop.done(paused_time_elapsed):
+                screen.blit(printtext, text_rect)
+                buttons.draw(screen)
+
+            presenter.invalidate()
+
+        elif hovered:
+            for rect in hovered:
+                screen.blit(backdrop.get(paused_time_elapsed), rect, rect)
+            buttons.draw(screen)
+            presenter.invalidate_all(hovered)
+
+        presenter.present()
+        await presenter.idle(animating=not backdrop.done(paused_time_elapsed))
+
+async def level_completed(screen, level_name, text_color, window_size, popup_text, time_finished, total_time):
+    
+    backdrop = Backdrop(screen, max_blur_radius=10, blur_duration=0)
+
+    font = get_font('fonts/MajorMonoDisplay-Regular.ttf', 55)
+    lil_font = get_font('fonts/pixelated.ttf', 40)
+    button_image = load_image("Buttons/tutorial_button.png")
+
+    printtext = font.render(f"{level_name} complete!", True, text_color)
+    printtime = lil_font.render(f"Time: {total_time}", True, text_color)
+    text_rect = printtext.get_rect(center=(window_size[0] // 2, window_size[1] // 2 - 200))
+    time_rect = printtime.get_rect(center=(window_size[0] // 2, 500))
+    hovering_color = "#F59071"
+
+    artifact_information = Popup(name="artifact_info", screen=screen, text=popup_text, theme_color=text_color, button_text="cool", visible=False)
+    where_level_select = Popup(name="level_selection", screen=screen, text="in the homescreen, press l or stand on the green platform and press enter to enter level selection.", theme_color=text_color, button_text="got it", visible=False)
+    popups = [artifact_information, where_level_select]
+
+    artifact_information.font_size, artifact_information.max_line_length = 23, 40
+
+    RESTART_LEVEL = Button(image=button_image, pos=(395, 295), text_input="restart", font=get_font('fonts/pixelated.ttf', 25), base_color=text_color, hovering_color=hovering_color)
+    ARTIFACT_INFO = Button(image=button_image, pos=(605, 295), text_input="artifact info", font=get_font('fonts/pixelated.ttf', 25), base_color=text_color, hovering_color=hovering_color)
+    LEVEL_SELECT = Button(image=button_image, pos=(395, 365), text_input="level select", font=get_font('fonts/pixelated.ttf', 25), base_color=text_color, hovering_color=hovering_color)
+    MAIN_MENU = Button(image=button_image, pos=(605, 365), text_input="home", font=get_font('fonts/pixelated.ttf', 40), base_color=text_color, hovering_color=hovering_color)
+    buttons = ButtonGroup([RESTART_LEVEL, ARTIFACT_INFO, LEVEL_SELECT, MAIN_MENU])
+    presenter = Presenter(screen)
+
+    while True:
+        
+        MENU_MOUSE_POS = pygame.mouse.get_pos()
+        time_elapsed = time.time() - time_finished
+        popup_open = any(popup.visible for popup in popups)
+        redraw = presenter.full or not backdrop.done(time_elapsed)
+        
+        for event in presenter.events():
+            # Popup buttons are drawn by the popups themselves, so while one is open any mouse movement redraws the screen
+            redraw = redraw or changes_screen(event) or popup_open
+            
+            for popup in popups:
+                popup.handle_event(event)
+
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                exit()
+
+            elif event.type == pygame.MOUSEBUTTONDOWN and not artifact_information.visible and not where_level_select.visible:
+                
+                if RESTART_LEVEL.checkForInput(MENU_MOUSE_POS):
+                    return "level restart"
+                
+                elif ARTIFACT_INFO.checkForInput(MENU_MOUSE_POS):
+                    artifact_information.visible = True
+
+                elif LEVEL_SELECT.checkForInput(MENU_MOUSE_POS):
+                    if level_name == "Training":
+                        where_level_select.visible = True
+                    else:
+                        return "go to level select"
+                
+                elif MAIN_MENU.checkForInput(MENU_MOUSE_POS):
+                    return "go to home"
+
+        hovered = buttons.hover(MENU_MOUSE_POS)
+
+        if redraw:
+            screen.blit(backdrop.get(time_elapsed), (0, 0))
+            
+            if backdrop.done(time_elapsed):
+                screen.blit(printtext, text_rect)
+                screen.blit(printtime, time_rect)
+                buttons.draw(screen)
+                
+                for popup in popups:
+                    popup.update()
+
+            presenter.invalidate()
+
+        elif hovered and not popup_open:
+            for rect in hovered:
+                screen.blit(backdrop.get(time_elapsed), rect, rect)
+            buttons.draw(screen)
+            presenter.invalidate_all(hovered)
+
+        presenter.present()
+        await presenter.idle(animating=not backdrop.done(time_elapsed))
@@ -1,8 +1,11 @@
 import pygame
 from Buttons.buttons import Button
-from PIL import Image, ImageFilter
+from text_cache import render_text
+from font_registry import get_font
 
 class Popup:
+    _background_cache = {}
+
     def __init__(self, name, screen, text, theme_color, button_text, visible, max_line_length=35, font_size=30):
         """
         Initialize the Popup object.
@@ -23,8 +26,10 @@ class Popup:
         self.theme_color = theme_color
         self.button_text = button_text
         self._font_size = font_size
-        self.font = pygame.font.Font('fonts/pixelated.ttf', self._font_size)  # Font for the popup text
+        self.font = get_font('fonts/pixelated.ttf', self._font_size)  # Font for the popup text
         self.max_line_length = max_line_length  # Maximum character length per line
+        self._wrapped_key = None  # Text and line length the cached lines were wrapped for
+        self._wrapped_lines = []
         # Create the button
         self.button = Button(image=None, pos=(self.screen.get_width() // 2, self.screen.get_height() // 2 + 165),
                              text_input=self.button_text,
@@ -40,7 +45,7 @@ class Popup:
     @font_size.setter
     def font_size(self, value):
         self._font_size = value
-        self.font = pygame.font.Font('fonts/pixelated.ttf', self._font_size)
+        self.font = get_font('fonts/pixelated.ttf', self._font_size)
     
     def draw(self):
         """Draw the popup on the screen."""
@@ -53,31 +58,37 @@ class Popup:
     def _draw_blurred_background(self):
         """Draw a blurred background behind the popup."""
         popup_rect = pygame.Rect(self.screen.get_width() // 2 - 400, self.screen.get_height() // 2 - 100, 800, 300)
-        
-        # Create an off-screen surface to apply Gaussian blur
-        background_surface = pygame.Surface((popup_rect.width, popup_rect.height), pygame.SRCALPHA)
-        background_surface.fill((0, 0, 0, 200))  # Semi-transparent black background
-        
-        # Apply Gaussian blur using PIL
-        image_pil = Image.frombytes('RGBA', background_surface.get_size(), pygame.image.tostring(background_surface, 'RGBA'))
-        blurred_image_pil = image_pil.filter(ImageFilter.GaussianBlur(6))  # Adjust the blur intensity
-        background_surface = pygame.image.fromstring(blurred_image_pil.tobytes(), blurred_image_pil.size, 'RGBA')
+
+        # The background is a flat semi-transparent fill (blurring it changes nothing), so it is built once and shared
+        background_surface = Popup._background_cache.get(popup_rect.size)
+        if background_surface is None:
+            background_surface = pygame.Surface(popup_rect.size, pygame.SRCALPHA)
+            background_surface.fill((0, 0, 0, 200))  # Semi-transparent black background
+            Popup._background_cache[popup_rect.size] = background_surface
 
         # Blit the blurred background surface
         self.screen.blit(background_surface, popup_rect.topleft)
 
     def _draw_text(self):
         """Render and draw the popup text with line breaks if necessary."""
-        lines = self._split_text_into_lines(self.text, self.max_line_length)
+        lines = self._lines()
         line_spacing = 10
         y_offset = self.screen.get_height() // 2 - 50  # Starting y position for the first line
 
         for line in lines:
-            text_surface = self.font.render(line, True, '#FFFFFF')  # White text
+            text_surface = render_text('fonts/pixelated.ttf', self._font_size, line, '#FFFFFF')  # White text
             text_rect = text_surface.get_rect(center=(self.screen.get_width() // 2, y_offset))
             self.screen.blit(text_surface, text_rect)
             y_offset += text_rect.height + line_spacing
 
+    def _lines(self):
+        """Returns the wrapped lines of the text, only splitting again when the text or line length changed."""
+        key = (self.text, self.max_line_length)
+        if self._wrapped_key != key:
+            self._wrapped_key = key
+            self._wrapped_lines = self._split_text_into_lines(self.text, self.max_line_length)
+        return self._wrapped_lines
+
     def _split_text_into_lines(self, text, max_length):
         """Split the text into lines based on max length."""
         words = text.split()
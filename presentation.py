@@ -0,0 +1,103 @@
+import time
+import asyncio
+import pygame
+from frame_profiler import profiler
+
+class Presenter:
+    def __init__(self, screen, idle_timeout=0.25, poll_interval=1 / 120):
+        """
+        Sends only the parts of the screen that changed to the display, and lets a loop idle while nothing is happening.
+        Meant for menus and other mostly static screens, levels redraw everything every frame and should keep using flip().
+
+        Args:
+            screen (pygame.Surface): Display surface.
+            idle_timeout (float): Longest time idle() waits for input before returning anyway (so clocks still tick).
+            poll_interval (float): How often idle() checks for input while waiting.
+        """
+        self.screen = screen
+        self.idle_timeout = idle_timeout
+        self.poll_interval = poll_interval
+        self.full = True  # The first present of a screen always sends everything
+        self.dirty = []
+        profiler.begin_frame()
+
+    def invalidate(self, rect=None):
+        """
+        Marks part of the screen as changed.
+
+        Args:
+            rect (pygame.Rect): Area that changed, None for the whole screen.
+        """
+        if rect is None:
+            self.full = True
+        else:
+            self.dirty.append(pygame.Rect(rect))
+
+    def events(self):
+        """Returns this frame's events (see get_events), redrawing the whole screen when the profiler overlay is toggled."""
+        was_profiling = profiler.enabled
+        events = get_events()
+        if profiler.enabled != was_profiling:
+            self.invalidate()
+        profiler.mark("input")
+        return events
+
+    def invalidate_all(self, rects):
+        for rect in rects:
+            self.invalidate(rect)
+
+    @property
+    def needs_present(self):
+        return self.full or bool(self.dirty)
+
+    def present(self):
+        """Sends the changed areas to the display. Returns False if nothing had changed."""
+        profiler.mark("hud")
+
+        if profiler.enabled:
+            # The overlay is drawn over the menu, which has to be redrawn under it next frame
+            profiler.draw(self.screen)
+            profiler.skip()
+            self.full = True
+
+        if self.full:
+            pygame.display.flip()
+        elif self.dirty:
+            pygame.display.update(self.dirty)
+        else:
+            return False
+
+        profiler.mark("flip")
+        profiler.end_frame()
+        self.full = profiler.enabled
+        self.dirty = []
+        return True
+
+    async def idle(self, animating=False):
+        """
+        Yields to the event loop until the next frame should run. While animating this is a plain asyncio.sleep(0),
+        otherwise it sleeps until input arrives (or idle_timeout passes) instead of spinning.
+
+        Args:
+            animating (bool): Something on screen is changing on its own (a blur fading in, a timer...).
+        """
+        if animating:
+            await asyncio.sleep(0)
+        else:
+            deadline = time.perf_counter() + self.idle_timeout
+            while not pygame.event.peek() and time.perf_counter() < deadline:
+                await asyncio.sleep(self.poll_interval)
+
+        # Time spent waiting isn't part of the next frame
+        profiler.begin_frame()
+
+def get_events():
+    """pygame.event.get() for every game loop: F3 toggles the frame profiler (see frame_profiler.py) on any screen."""
+    events = pygame.event.get()
+    for event in events:
+        profiler.handle_event(event)
+    return events
+
+def changes_screen(event):
+    """True for events that can change a menu's screen (anything but mouse motion, which only changes button hovers)."""
+    return event.type != pygame.MOUSEMOTION
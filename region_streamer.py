@@ -0,0 +1,73 @@
+"""Streams a level in square regions around the players, so what is kept in memory (baked platform chunks, volcano
+sprites and animations) depends on what the players can see instead of on the size of the whole map."""
+
+import pygame
+from level_entities import LazyEntities
+
+class RegionStreamer:
+    def __init__(self, view_size, region_size=512, lookahead=0.5, bake_budget=2):
+        """
+        Every frame, works out the regions each player can see (plus where they are heading), bakes the static platform
+        chunks there a few at a time before they scroll into view, builds lazy entities around them and evicts chunks and
+        entities that fell behind.
+
+        Args:
+            view_size (tuple): (width, height) of the world a viewport shows around its player.
+            region_size (int): Width and height of a region in world pixels (the static layer's chunk size).
+            lookahead (float): Seconds of player movement to stream ahead of the view.
+            bake_budget (int): Most chunks baked ahead of time in one frame, so streaming never causes a hitch itself.
+        """
+        self.view_size = view_size
+        self.region_size = region_size
+        self.lookahead = lookahead
+        self.bake_budget = bake_budget
+        self.baked = 0
+        self.evicted = 0
+
+    def focus_rects(self, players):
+        """Returns the world-space area each player can see, stretched towards where they are moving."""
+        rects = []
+        for player in players:
+            view = pygame.Rect((0, 0), self.view_size)
+            view.center = player.rect.center
+            ahead = view.move(player.velocity.x * self.lookahead, player.velocity.y * self.lookahead)
+            rects.append(view.union(ahead))
+        return rects
+
+    def update(self, players, layer=None, entities=(), flashlight_enabled=False):
+        """
+        Streams regions in and out around the players.
+
+        Args:
+            players (list): Active players.
+            layer (StaticPlatformLayer): The level's static platform layer (None to leave platforms alone).
+            entities (list): Entity collections of the level, LazyEntities among them are built and released.
+            flashlight_enabled (bool): Which version of the platform chunks to bake.
+        """
+        focus = self.focus_rects(players)
+        # Streamed in half a region early and only evicted a full region later, so standing on a border doesn't thrash
+        wanted = [rect.inflate(self.region_size, self.region_size) for rect in focus]
+        kept = [rect.inflate(self.region_size * 2, self.region_size * 2) for rect in focus]
+
+        for collection in entities:
+            if isinstance(collection, LazyEntities):
+                for rect in wanted:
+                    collection.realize(rect)
+                collection.release(kept)
+
+        if layer is None:
+            return
+
+        centers = [rect.center for rect in focus]
+        size = layer.chunk_size
+
+        def distance(key):
+            chunk_center = (key[0] * size + size / 2, key[1] * size + size / 2)
+            return min((chunk_center[0] - x) ** 2 + (chunk_center[1] - y) ** 2 for x, y in centers)
+
+        missing = {key for rect in wanted for key in layer.chunks_in(rect) if not layer.is_baked(key, flashlight_enabled)}
+        for key in sorted(missing, key=distance)[:self.bake_budget]:
+            layer.prefetch(key, flashlight_enabled)
+            self.baked += 1
+
+        self.evicted += layer.evict({key for rect in kept for key in layer.chunks_in(rect)})
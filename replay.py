@@ -0,0 +1,229 @@
+"""Input recording and replay. A recording stores, for every frame of a level, how many fixed steps ran (frames without a
+step are recorded too, since the per-frame level rules still ran), which control keys were held, whether a popup was
+blocking controls and whether the players respawned (R or the reload button). Frames that repeat are run-length encoded, so a few minutes of play is
+a few kilobytes of json. Replaying feeds the same keys through the same fixed steps, which reproduces the run exactly.
+
+Set PARKOUR_RECORD=<file.json> to record every level you play, or PARKOUR_REPLAY=<file.json> to replay one in the game at
+real speed. `python replay.py <file.json>` replays a recording headlessly as fast as possible."""
+
+import os
+import json
+import random
+import time
+import functools
+import pygame
+from simulation import KeyState, World, load_player_controls
+
+RECORDING_VERSION = 1
+
+class InputRecording:
+    def __init__(self, level_name, num_of_players, key_codes, seed, fixed_delta_time=1 / 60, frames=None):
+        """
+        Per-frame input of a single run of a level.
+
+        Args:
+            level_name (str): Level the run was played in.
+            num_of_players (int): Number of players in the run.
+            key_codes (list): pygame key constants the masks are built from (bit i = key_codes[i]).
+            seed (int): Seed given to random before the level was built, so storms and volcanoes repeat too.
+            fixed_delta_time (float): Seconds per fixed step.
+            frames (list): Run-length encoded frames, each [repeat, steps, key mask, popup_active, reload].
+        """
+        self.level_name = level_name
+        self.num_of_players = num_of_players
+        self.key_codes = list(key_codes)
+        self.seed = seed
+        self.fixed_delta_time = fixed_delta_time
+        self.frames = frames if frames is not None else []
+        self._bits = {key: 1 << bit for bit, key in enumerate(self.key_codes)}
+
+    def mask(self, keys):
+        """Packs the held control keys into an int."""
+        mask = 0
+        for key, bit in self._bits.items():
+            if keys[key]:
+                mask |= bit
+        return mask
+
+    def keys(self, mask):
+        """Unpacks a mask back into a KeyState."""
+        return KeyState(key for key, bit in self._bits.items() if mask & bit)
+
+    def add_frame(self, steps, keys, popup_active, reload=False):
+        frame = [steps, self.mask(keys), int(popup_active), int(reload)]
+        if self.frames and self.frames[-1][1:] == frame:
+            self.frames[-1][0] += 1
+        else:
+            self.frames.append([1] + frame)
+
+    def __iter__(self):
+        """Yields (steps, keys, popup_active, reload) for every recorded frame."""
+        for repeat, steps, mask, popup_active, reload in self.frames:
+            keys = self.keys(mask)
+            for _ in range(repeat):
+                yield steps, keys, bool(popup_active), bool(reload)
+
+    @property
+    def total_steps(self):
+        return sum(repeat * steps for repeat, steps, *_ in self.frames)
+
+    def save(self, path):
+        with open(path, 'w') as recording_file:
+            json.dump({
+                "version": RECORDING_VERSION,
+                "level": self.level_name,
+                "players": self.num_of_players,
+                "keys": self.key_codes,
+                "seed": self.seed,
+                "fixed_delta_time": self.fixed_delta_time,
+                "frames": self.frames
+            }, recording_file, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r') as recording_file:
+            data = json.load(recording_file)
+
+        if data["version"] != RECORDING_VERSION:
+            raise ValueError(f"{path} is a version {data['version']} recording, expected version {RECORDING_VERSION}")
+
+        return cls(data["level"], data["players"], data["keys"], data["seed"], data["fixed_delta_time"], data["frames"])
+
+class InputSession:
+    def __init__(self, level_name, record_path=None, replay_path=None):
+        """
+        Sits between the keyboard and the fixed-step loop of a level, recording or replaying the keys of every step.
+        Without a path it just passes live input through.
+
+        Args:
+            level_name (str): Level being played.
+            record_path (str): Where to save the recording when the level is left (None to not record).
+            replay_path (str): Recording to play back instead of live input (None to play live).
+        """
+        self.level_name = level_name
+        self.record_path = record_path
+        self.recording = None
+        self.replay = None
+        self.take = 1
+
+        if replay_path:
+            recording = InputRecording.load(replay_path)
+            if recording.level_name == level_name:
+                self.replay = iter(recording)
+                random.seed(recording.seed)
+            else:
+                print(f"{replay_path} was recorded in {recording.level_name}, playing {level_name} live")
+
+        elif record_path:
+            self._start_take()
+
+    @classmethod
+    def from_env(cls, level_name):
+        """Creates the session for a level from the PARKOUR_RECORD / PARKOUR_REPLAY environment variables."""
+        return cls(level_name, os.environ.get("PARKOUR_RECORD"), os.environ.get("PARKOUR_REPLAY"))
+
+    def _start_take(self):
+        seed = int(time.time() * 1000) & 0xFFFFFFFF
+        random.seed(seed)
+        key_codes = sorted({getattr(pygame, key) for controls in load_player_controls().values() for key in controls.values()})
+        self.recording = InputRecording(self.level_name, 0, key_codes, seed)
+
+    def _take_path(self):
+        if self.take == 1:
+            return self.record_path
+        root, extension = os.path.splitext(self.record_path)
+        return f"{root}-{self.take}{extension}"
+
+    def frame(self, keys, popup_active, steps, num_of_players=1, reload=False):
+        """
+        Returns (steps, keys, popup_active, reload) to run this frame with: the live ones (recorded if a recording is being
+        made), or the recorded ones while replaying.
+
+        Args:
+            keys: Keys sampled from the keyboard this frame.
+            popup_active (bool): Whether a popup is blocking player controls this frame.
+            steps (int): How many steps the accumulator asks for (ignored while replaying, the recorded count is used).
+            num_of_players (int): Players in the level (saved with the recording).
+            reload (bool): Whether the players asked to respawn this frame (ignored while replaying, like the keys).
+        """
+        if self.replay is not None:
+            frame = next(self.replay, None)
+            if frame is not None:
+                return frame
+            print(f"Replay of {self.level_name} finished, back to live input")
+            self.replay = None
+
+        elif self.recording is not None:
+            self.recording.num_of_players = num_of_players
+            self.recording.add_frame(steps, keys, popup_active, reload)
+
+        return steps, keys, popup_active, reload
+
+    def restart(self):
+        """Call before a level restart: saves the current take and starts a new one (or stops replaying)."""
+        if self.recording is not None:
+            self.close()
+            self.take += 1
+            self._start_take()
+        self.replay = None
+
+    def close(self):
+        """Saves the recording, if one is being made."""
+        if self.recording is not None and self.recording.frames:
+            path = self._take_path()
+            self.recording.save(path)
+            print(f"Saved {self.recording.total_steps} recorded steps of {self.level_name} to {path}")
+
+def recordable(level_name):
+    """
+    Decorator for the async level functions in main.py: creates the level's InputSession before the level is built (so the
+    random seed is fixed first), passes it in as input_session and saves the recording however the level is left.
+    """
+    def decorator(level_function):
+        @functools.wraps(level_function)
+        async def run_level(active_players):
+            input_session = InputSession.from_env(level_name)
+            try:
+                return await level_function(active_players, input_session)
+            finally:
+                input_session.close()
+        return run_level
+    return decorator
+
+def replay_headless(recording, **entities):
+    """
+    Replays a recording in a headless World as fast as possible (nothing is drawn).
+    Returns the world and the wall-clock seconds the replay took.
+
+    Args:
+        recording (InputRecording): Recording to replay.
+    """
+    random.seed(recording.seed)
+    world = World.from_level(recording.level_name, recording.num_of_players, **entities)
+    started = time.perf_counter()
+
+    for steps, keys, popup_active, reload in recording:
+        world.frame_logic()
+        if reload:
+            world.reload()
+        for _ in range(steps):
+            world.physics_step(keys, popup_active)
+
+    return world, time.perf_counter() - started
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Replay an input recording headlessly, as fast as possible.")
+    parser.add_argument("recording", help="Recording made with PARKOUR_RECORD")
+    args = parser.parse_args()
+
+    recording = InputRecording.load(args.recording)
+    world, elapsed = replay_headless(recording)
+    simulated = recording.total_steps * recording.fixed_delta_time
+
+    print(f"{recording.level_name}: {recording.total_steps} steps ({simulated:.1f}s) replayed in {elapsed:.3f}s, {simulated / elapsed:.1f}x real time")
+    for player in world.players:
+        print(f"player{player.id}: position ({player.position.x:.0f}, {player.position.y:.0f}), on {player.on_platform.name if player.on_platform else None}")
+    if world.finished:
+        print(f"finish line reached after {world.finished_at:.2f}s")
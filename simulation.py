@@ -0,0 +1,286 @@
+"""Display-free game logic. Everything in here can run without a window (no pygame.display, no fonts, no surfaces), so
+physics can be stepped headlessly by the World class below, for example to batch-validate levels or benchmark physics
+on CI machines. The game imports the level helpers (reload_map, update_game_logic...) from here too."""
+
+import json
+import time
+from Players.player import Player
+from spatial_grid import SpatialGrid
+from level_bundle import CompiledLevel, get_compiled_level
+from level_entities import load_entities
+from region_streamer import RegionStreamer
+from game_clock import GameClock, default_clock
+
+def load_platforms(platform_data, level_name):
+    """Builds a level's platforms from its parsed json (levels with a compiled bundle skip this, see level_bundle.py)."""
+    return CompiledLevel.from_json(platform_data, level_name).build_platforms()
+
+def reload_map(active_players, platforms, reset_position, artifacts):
+
+    for platform in platforms:
+        platform.reset()
+
+    platforms.refresh()
+
+    for player in active_players:
+        player.reload(reset_position)
+
+    for artifact in artifacts:
+        artifact.reset()
+
+def update_game_logic(delta_time, active_players, platforms, keys, position, popup_active, ladders, hooks, clock=default_clock):
+
+    for player in active_players:
+        player.update(delta_time, keys, platforms, position, popup_active, ladders, hooks)
+        player.collisions(platforms)
+
+    for platform in platforms:
+        platform.update(delta_time)
+
+    # Moving platforms may have crossed into new grid cells
+    platforms.refresh()
+
+    clock.advance(delta_time)
+
+def get_special_platforms(platforms, level_name):
+
+    next_checkpoints = list()
+    deathforms = list()
+    checkpoint_num = 1
+    deathpoint_num = 1
+
+    for platform in platforms:
+
+        if platform.name == "starting-platform":
+            spawn_point = (platform.position.x + (platform.dimensions[0] / 2), platform.position.y - platform.dimensions[1])
+
+        elif platform.name == f"checkpoint{checkpoint_num}":
+            next_checkpoints.append(platform)
+            checkpoint_num += 1
+
+        elif platform.name == "finish-line":
+            finish_line = platform
+
+        elif platform.name == f"death-form{deathpoint_num}":
+            deathforms.append(platform)
+            deathpoint_num += 1
+
+    return spawn_point, deathforms, next_checkpoints, finish_line
+
+class KeyState:
+    def __init__(self, pressed=()):
+        """
+        Stand-in for pygame.key.get_pressed() when there is no window to read the keyboard from.
+
+        Args:
+            pressed (iterable): pygame key constants that are held down.
+        """
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+def load_level_data(level_name):
+    """Reads Levels/<level_name>/<level_name>.json (synchronously, main.py has its own pygbag-aware loader)."""
+    with open(f'Levels/{level_name}/{level_name}.json', 'r') as level_file:
+        return json.load(level_file)
+
+_player_controls = None
+
+def load_player_controls():
+    """Reads the key bindings of every player from Players/player_controls.json (only the first time)."""
+    global _player_controls
+    if _player_controls is None:
+        with open('Players/player_controls.json', 'r') as key_map:
+            _player_controls = json.load(key_map)['controls']['players']
+    return _player_controls
+
+class World:
+    def __init__(self, platforms, players, level_height, ladders=None, hooks=None, volcanoes=None, storm=None, fixed_delta_time=1 / 60, clock=None, streamer=None):
+        """
+        Headless simulation of a level: steps players, platforms, hooks, volcanoes and storms at a fixed dt, with the same
+        checkpoint, death and finish rules as the level loops in main.py, but without drawing anything.
+
+        Args:
+            platforms (SpatialGrid): Platforms returned by load_platforms.
+            players (list): Player objects to simulate.
+            level_height (int): Height of the level, players falling 100px below it respawn.
+            ladders (list): Ladder objects (optional).
+            hooks (list): Hook objects (optional).
+            volcanoes (list): Volcano objects, or LazyEntities that are built as players get near them (optional).
+            storm (Storm): Storm object (optional).
+            fixed_delta_time (float): Seconds simulated by each step.
+            clock (GameClock): Clock the world advances, volcanoes should be built with the same one (default: a new clock).
+            streamer (RegionStreamer): Builds and releases lazy volcanoes around the players, like LevelScene's does
+                (default: one with the game's 1000x700 view).
+        """
+        self.platforms = platforms
+        self.players = players
+        self.level_height = level_height
+        self.ladders = ladders if ladders is not None else []
+        self.hooks = hooks if hooks is not None else []
+        self.volcanoes = volcanoes if volcanoes is not None else []
+        self.storm = storm
+        self.fixed_delta_time = fixed_delta_time
+
+        self.spawn_point, self.death_platforms, self.next_checkpoints, self.finish_line = get_special_platforms(platforms, None)
+        self.OG_spawn_point = self.spawn_point
+        self.checkpoint_increment = 0
+        self.next_checkpoint = self.next_checkpoints[0] if self.next_checkpoints else None
+        self.clock = clock if clock is not None else GameClock()
+        self.streamer = streamer if streamer is not None else RegionStreamer(view_size=(1000, 700))
+        self.steps = 0
+        self.finished_at = None
+
+        for player in self.players:
+            player.reload(self.spawn_point)
+
+    @classmethod
+    def from_level(cls, level_name, num_of_players=1, **entities):
+        """
+        Builds a World for a level from its json file, with players spawned on the starting platform.
+        The ladders, hooks and volcanoes the json declares are loaded and levels with homeless-shelter platforms get their
+        Storm. Passing any of them (or clock) as a keyword argument replaces what the level declares.
+
+        Args:
+            level_name (str): Name of the level folder (ex: 'Magnus25').
+            num_of_players (int): How many players to simulate.
+        """
+        level = get_compiled_level(level_name)
+        controls = load_player_controls()
+        platforms = level.build_platforms()
+        spawn_point = level.spawn_point
+
+        if level.level_type == 'scrolling':
+            level_height = level.camera_dimensions[1]
+        else:
+            level_height = 700
+
+        players = [Player(player_id=number + 1, position=spawn_point, controls=controls[f'player{number + 1}'], color="#ffffff") for number in range(num_of_players)]
+
+        # Volcanoes are timed by the world's clock, so it has to exist before they are built
+        entities.setdefault('clock', GameClock())
+        for kind, objects in load_entities({level_name: level.data}, level_name, clock=entities['clock']).items():
+            entities.setdefault(kind, objects)
+
+        shelters = []
+        for platform in platforms:
+            if platform.name == f"homeless-shelter{len(shelters) + 1}":
+                shelters.append(platform)
+
+        if shelters and 'storm' not in entities:
+            from Levels.Magnus25.storm import Storm
+            entities['storm'] = Storm(trigger_distance=150, platforms=shelters, font=None, screen_size=(1000, 700))
+
+        return cls(platforms, players, level_height, **entities)
+
+    @property
+    def time(self):
+        return self.clock.now()
+
+    @property
+    def finished(self):
+        return self.finished_at is not None
+
+    def frame_logic(self):
+        """Applies the per-frame level rules (volcanoes, storm, falling, death platforms, checkpoints, finish line)."""
+        # Same streaming and rule order as LevelScene.run, so volcanoes are built (and use random) on the same frames
+        self.streamer.update(self.players, entities=[self.volcanoes])
+
+        for player in self.players:
+
+            if self.storm:
+                self.storm.update(player, self.spawn_point, current_time=self.time)
+
+            for volcano in self.volcanoes:
+                volcano.interact_with_player(player, self.volcanoes)
+
+            if player.position.y > self.level_height + 100:
+                player.reload(self.spawn_point)
+
+            if player.on_platform == self.finish_line and not self.finished:
+                self.finished_at = self.time
+
+            if player.on_platform in self.death_platforms:
+                player.reload(self.spawn_point)
+
+            if self.next_checkpoint and player.on_platform == self.next_checkpoint:
+                checkpoint = self.next_checkpoint
+                self.spawn_point = (checkpoint.position.x + (checkpoint.dimensions[0] / 2), checkpoint.start_position.y - checkpoint.dimensions[1])
+
+                if self.checkpoint_increment < len(self.next_checkpoints) - 1:
+                    self.checkpoint_increment += 1
+                    self.next_checkpoint = self.next_checkpoints[self.checkpoint_increment]
+
+    def reload(self):
+        """Respawns the players at the last checkpoint, like pressing R (or the reload button) in the game."""
+        reload_map(self.players, self.platforms, self.spawn_point, ())
+
+    def physics_step(self, keys, popup_active=False):
+        """
+        Advances players, platforms, hooks and volcanoes by one fixed step.
+
+        Args:
+            keys: Held keys, either pygame.key.get_pressed() or a KeyState.
+            popup_active (bool): Whether a popup was blocking player controls.
+        """
+        update_game_logic(self.fixed_delta_time, self.players, self.platforms, keys, self.spawn_point, popup_active, self.ladders, self.hooks, self.clock)
+
+        for hook in self.hooks:
+            hook.update(self.fixed_delta_time)
+
+        if isinstance(self.hooks, SpatialGrid):
+            self.hooks.refresh()
+
+        for volcano in self.volcanoes:
+            volcano.update()
+
+        self.steps += 1
+
+    def step(self, keys, popup_active=False):
+        """
+        Runs the level rules and one fixed step, like a game frame that only needed a single step.
+
+        Args:
+            keys: Held keys, either pygame.key.get_pressed() or a KeyState.
+            popup_active (bool): Whether a popup was blocking player controls.
+        """
+        self.frame_logic()
+        self.physics_step(keys, popup_active)
+
+    def run(self, steps, keys=KeyState()):
+        """
+        Runs the given number of steps as fast as possible with the same held keys and returns the wall-clock seconds it took.
+
+        Args:
+            steps (int): Number of fixed steps to simulate.
+            keys: Held keys for every step (a function taking the step number and returning keys also works).
+        """
+        started = time.perf_counter()
+
+        for step in range(steps):
+            self.step(keys(self.steps) if callable(keys) else keys)
+
+        return time.perf_counter() - started
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Step a level headlessly and report how much faster than real time physics runs.")
+    parser.add_argument("level", help="Level folder name, ex: Magnus25")
+    parser.add_argument("--seconds", type=float, default=60, help="Simulated seconds to run")
+    parser.add_argument("--players", type=int, default=1, help="Number of players to simulate")
+    parser.add_argument("--hold", nargs="*", default=["right"], help="Actions every player holds down (left, right, jump, slide)")
+    args = parser.parse_args()
+
+    world = World.from_level(args.level, args.players)
+    held_keys = KeyState(player.controls[action] for player in world.players for action in args.hold)
+    steps = int(args.seconds / world.fixed_delta_time)
+    elapsed = world.run(steps, held_keys)
+
+    print(f"{args.level}: {steps} steps ({args.seconds:.0f}s simulated) in {elapsed:.3f}s wall, "
+          f"{steps / elapsed:.0f} steps/s, {args.seconds / elapsed:.1f}x real time")
+    for player in world.players:
+        print(f"player{player.id}: position ({player.position.x:.0f}, {player.position.y:.0f}), on {player.on_platform.name if player.on_platform else None}")
+    if world.finished:
+        print(f"finish line reached after {world.finished_at:.2f}s")
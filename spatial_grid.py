@@ -0,0 +1,118 @@
+class SpatialGrid:
+    def __init__(self, objects, get_rect=lambda obj: obj.rect, is_moving=lambda obj: False, cell_size=256):
+        """
+        Uniform grid that buckets objects by the cells their rect overlaps, so collision checks only look at nearby objects
+        instead of every object in the level.
+
+        Args:
+            objects (list): Objects to index (platforms, ladders, hooks...). Iteration order is preserved.
+            get_rect (function): Returns the world-space pygame.Rect of an object.
+            is_moving (function): Returns True for objects whose rect can change, these get rebucketed in refresh().
+            cell_size (int): Width and height of a grid cell in world pixels.
+        """
+        self.objects = list(objects)
+        self.get_rect = get_rect
+        self.cell_size = cell_size
+        self.cells = {}
+        self.object_cells = {}
+        self.moving = []
+
+        for index, obj in enumerate(self.objects):
+            self._insert(index, self._cell_range(get_rect(obj)))
+            if is_moving(obj):
+                self.moving.append(index)
+
+    @classmethod
+    def from_cells(cls, objects, cells, object_cells, get_rect=lambda obj: obj.rect, is_moving=lambda obj: False, cell_size=256):
+        """
+        Builds a grid from buckets computed ahead of time (see level_bundle.py) instead of bucketing every object again.
+
+        Args:
+            objects (list): Objects the buckets index into.
+            cells (dict): (cell x, cell y) -> list of object indexes.
+            object_cells (dict): Object index -> (left, top, right, bottom) cell range it was bucketed in.
+        """
+        grid = cls([], get_rect=get_rect, cell_size=cell_size)
+        grid.objects = list(objects)
+        grid.cells = {cell: list(indexes) for cell, indexes in cells.items()}
+        grid.object_cells = dict(object_cells)
+        grid.moving = [index for index, obj in enumerate(grid.objects) if is_moving(obj)]
+        return grid
+
+    def __iter__(self):
+        return iter(self.objects)
+
+    def __len__(self):
+        return len(self.objects)
+
+    def __contains__(self, obj):
+        return obj in self.objects
+
+    def __getitem__(self, index):
+        return self.objects[index]
+
+    def _cell_range(self, rect):
+        size = self.cell_size
+        return (rect.left // size, rect.top // size, (rect.right - 1) // size, (rect.bottom - 1) // size)
+
+    def _insert(self, index, cell_range):
+        left, top, right, bottom = cell_range
+        for cell_x in range(left, right + 1):
+            for cell_y in range(top, bottom + 1):
+                self.cells.setdefault((cell_x, cell_y), []).append(index)
+        self.object_cells[index] = cell_range
+
+    def _remove(self, index):
+        left, top, right, bottom = self.object_cells.pop(index)
+        for cell_x in range(left, right + 1):
+            for cell_y in range(top, bottom + 1):
+                bucket = self.cells[(cell_x, cell_y)]
+                bucket.remove(index)
+                if not bucket:
+                    del self.cells[(cell_x, cell_y)]
+
+    def refresh(self):
+        """Rebuckets moving objects whose rect crossed into different cells since the last refresh."""
+        for index in self.moving:
+            cell_range = self._cell_range(self.get_rect(self.objects[index]))
+            if cell_range != self.object_cells[index]:
+                self._remove(index)
+                self._insert(index, cell_range)
+
+    def query(self, rect):
+        """
+        Returns the objects whose cells overlap the given rect, in the same order they were indexed in.
+
+        Args:
+            rect (pygame.Rect): World-space area to look around.
+        """
+        left, top, right, bottom = self._cell_range(rect)
+        cells = self.cells
+        found = set()
+
+        for cell_x in range(left, right + 1):
+            for cell_y in range(top, bottom + 1):
+                bucket = cells.get((cell_x, cell_y))
+                if bucket:
+                    found.update(bucket)
+
+        return [self.objects[index] for index in sorted(found)]
+
+def nearby(objects, rect):
+    """Narrows a SpatialGrid down to the objects around rect, plain lists are returned as is."""
+    if isinstance(objects, SpatialGrid):
+        return objects.query(rect)
+    return objects
+
+def platform_grid(platforms, cell_size=256, cells=None, object_cells=None):
+    """
+    Builds the SpatialGrid used for level platforms, only moving platforms are rebucketed every step.
+    Pass cells and object_cells from a compiled level to skip bucketing.
+    """
+    if cells is not None:
+        return SpatialGrid.from_cells(platforms, cells, object_cells, get_rect=lambda platform: platform.rect, is_moving=lambda platform: platform.is_moving, cell_size=cell_size)
+    return SpatialGrid(platforms, get_rect=lambda platform: platform.rect, is_moving=lambda platform: platform.is_moving, cell_size=cell_size)
+
+def hook_grid(hooks, cell_size=256):
+    """Builds a SpatialGrid of swinging hooks, indexed by their hitbox (which moves every step)."""
+    return SpatialGrid(hooks, get_rect=lambda hook: hook.hitbox, is_moving=lambda hook: True, cell_size=cell_size)
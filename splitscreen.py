@@ -0,0 +1,131 @@
+"""Split-screen layout. One viewport per player, each with its own camera sized to the viewport, so players are centered
+in their own view without per-layout camera offsets. Subsurfaces, cameras and scaled backgrounds are built once per
+player count instead of every frame. Any number of players gets a grid, and the world is culled once against what all
+the viewports show together before each viewport draws its own part of it."""
+
+import math
+import pygame
+from camera import Camera
+from spatial_grid import nearby
+
+class SplitscreenCompositor:
+    def __init__(self, canvas, level_width, level_height, zoom=1.0, divider_color=(255, 255, 255), divider_width=5):
+        """
+        Args:
+            canvas (pygame.Surface): Off-screen surface the viewports are subsurfaces of.
+            level_width (int): Width of the level, cameras don't scroll past it.
+            level_height (int): Height of the level.
+            zoom (float): Zoom of every viewport's camera.
+            divider_color: Color of the lines between viewports.
+            divider_width (int): Width of the lines between viewports.
+        """
+        self.canvas = canvas
+        self.level_width = level_width
+        self.level_height = level_height
+        self.zoom = zoom
+        self.divider_color = divider_color
+        self.divider_width = divider_width
+        self.num_of_players = None
+        self.viewports = []
+        self.subscreens = []
+        self.cameras = []
+        self.backgrounds = {}
+        self.world_view = pygame.Rect(0, 0, level_width, level_height)
+
+    @staticmethod
+    def viewport_rects(num_of_players, size):
+        """
+        Returns where each player's viewport goes on a surface of the given size. One player gets the whole surface and
+        three players get stacked rows, any other number gets a grid about as many columns wide as it is rows tall
+        (side by side for two, 2x2 for four, 3x2 for six...). Viewports in an unfinished last row share its full width.
+        """
+        width, height = size
+        if num_of_players <= 1:
+            return [pygame.Rect(0, 0, width, height)]
+        elif num_of_players == 3:
+            return [pygame.Rect(0, row * height // 3, width, height // 3) for row in range(3)]
+
+        columns = math.ceil(math.sqrt(num_of_players))
+        rows = math.ceil(num_of_players / columns)
+        viewports = []
+        for index in range(num_of_players):
+            row, column = divmod(index, columns)
+            in_row = min(columns, num_of_players - row * columns)
+            # Edges are worked out from the next viewport's start, so rounding never leaves a gap
+            left, right = column * width // in_row, (column + 1) * width // in_row
+            top, bottom = row * height // rows, (row + 1) * height // rows
+            viewports.append(pygame.Rect(left, top, right - left, bottom - top))
+        return viewports
+
+    def set_players(self, num_of_players):
+        """Builds the viewports, subsurfaces and cameras for a player count (does nothing if it hasn't changed)."""
+        if num_of_players == self.num_of_players:
+            return
+
+        self.num_of_players = num_of_players
+        self.viewports = self.viewport_rects(num_of_players, self.canvas.get_size())
+        self.subscreens = [self.canvas.subsurface(viewport) for viewport in self.viewports]
+        self.cameras = [Camera(width=self.level_width, height=self.level_height, window_size=viewport.size, zoom=self.zoom) for viewport in self.viewports]
+        self.backgrounds = {}
+
+    def set_zoom(self, zoom):
+        """Zooms every viewport's camera (ex: a zoomed out overview), images are drawn at that zoom from the ZoomCache."""
+        self.zoom = zoom
+        for camera in self.cameras:
+            camera.zoom = max(0.1, zoom)
+
+    def background(self, bg_image, size):
+        """Returns bg_image scaled to a viewport size, scaling it only the first time."""
+        key = (id(bg_image), tuple(size))
+        scaled = self.backgrounds.get(key)
+        if scaled is None:
+            scaled = pygame.transform.scale(bg_image, size)
+            self.backgrounds[key] = scaled
+        return scaled
+
+    def follow(self, active_players):
+        """
+        Moves every camera to its player. Returns the world-space area the viewports show between them, which cull()
+        checks objects against.
+        """
+        self.set_players(len(active_players))
+        for player, camera in zip(active_players, self.cameras):
+            camera.update(player)
+        self.world_view = self.cameras[0].camera_rect.unionall([camera.camera_rect for camera in self.cameras[1:]])
+        return self.world_view
+
+    def cull(self, objects, get_rect, margin=0):
+        """
+        Returns (object, world rect) for the objects some viewport can see, call follow() first. Done once per frame, so
+        each viewport only checks what survived instead of every object in the level.
+
+        Args:
+            objects (iterable): Objects to cull, SpatialGrids are only searched around the viewports.
+            get_rect (function): Returns the world-space pygame.Rect an object is drawn in.
+            margin (int): How much wider to search a SpatialGrid, for objects drawn outside the rect they are indexed by.
+        """
+        world_view = self.world_view
+        found = []
+        for obj in nearby(objects, world_view.inflate(margin * 2, margin * 2)):
+            rect = get_rect(obj)
+            if world_view.colliderect(rect):
+                found.append((obj, rect))
+        return found
+
+    @staticmethod
+    def visible(camera, culled):
+        """Narrows what cull() returned down to the objects one camera can see."""
+        view = camera.camera_rect
+        return [obj for obj, rect in culled if view.colliderect(rect)]
+
+    def views(self, active_players):
+        """Yields (player, camera, subscreen) for every player, call follow() first so the cameras are in place."""
+        for player, camera, subscreen in zip(active_players, self.cameras, self.subscreens):
+            yield player, camera, subscreen
+
+    def draw_dividers(self):
+        for viewport in self.viewports:
+            if viewport.left > 0:
+                pygame.draw.line(self.canvas, self.divider_color, viewport.topleft, viewport.bottomleft, self.divider_width)
+            if viewport.top > 0:
+                pygame.draw.line(self.canvas, self.divider_color, viewport.topleft, viewport.topright, self.divider_width)
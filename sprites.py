@@ -1,25 +1,34 @@
 import pygame
 import json
 
+_sheets = {}
+
 class Spritesheet:
     def __init__(self, filename, width, height):
         self.filename = filename
         self.target_width = width
         self.target_height = height
         
-        try:
-            self.sprite_sheet = pygame.image.load(filename).convert_alpha()
-        except pygame.error as e:
-            print(f"Error loading sprite sheet: {e}")
-            raise
-        
+        # Sheets and their metadata are shared by every Spritesheet made from the same file
+        if filename not in _sheets:
+            try:
+                sprite_sheet = pygame.image.load(filename).convert_alpha()
+            except pygame.error as e:
+                print(f"Error loading sprite sheet: {e}")
+                raise
+            
+            meta_data = filename.replace('png', 'json')
+            try:
+                with open(meta_data) as f:
+                    data = json.load(f)
+            except FileNotFoundError:
+                print(f"Error: {meta_data} not found!")
+                raise
+
+            _sheets[filename] = (sprite_sheet, data)
+
         self.meta_data = self.filename.replace('png', 'json')
-        try:
-            with open(self.meta_data) as f:
-                self.data = json.load(f)
-        except FileNotFoundError:
-            print(f"Error: {self.meta_data} not found!")
-            raise
+        self.sprite_sheet, self.data = _sheets[filename]
 
     def get_sprite(self, x, y, w, h):
         sprite = pygame.Surface((w, h), pygame.SRCALPHA)
@@ -0,0 +1,122 @@
+import pygame
+from collections import OrderedDict
+from font_registry import get_font
+
+class TextCache:
+    def __init__(self, max_entries=512):
+        """
+        Least recently used cache of rendered text, so HUD labels, control hints and popup lines are only rasterized the
+        first time they are shown instead of every frame.
+
+        Args:
+            max_entries (int): How many rendered strings to keep before the least recently used ones are dropped.
+        """
+        self.max_entries = max_entries
+        self.surfaces = OrderedDict()
+
+    def render(self, font_path, size, text, color, antialias=True):
+        """
+        Returns the rendered surface for a string, rendering it only if it isn't cached. Don't draw on the returned surface,
+        it is shared.
+
+        Args:
+            font_path (str): Path to the .ttf file (ex: 'fonts/pixelated.ttf').
+            size (int): Font size.
+            text (str): Text to render.
+            color: Text color (anything pygame accepts as a color).
+            antialias (bool): Render with antialiasing.
+        """
+        key = (font_path, size, text, color, antialias)
+        surface = self.surfaces.get(key)
+
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+
+        surface = get_font(font_path, size).render(text, antialias, color)
+        self.surfaces[key] = surface
+
+        while len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+
+class DigitAtlas:
+    def __init__(self, font_path, size, color, characters="0123456789:."):
+        """
+        Pre-rendered glyphs for numbers that change every frame (timers, counters). Digits are laid out at a fixed width,
+        so a string is drawn with one blit per character and the text doesn't jitter as the digits change.
+
+        Args:
+            font_path (str): Path to the .ttf file.
+            size (int): Font size.
+            color: Glyph color.
+            characters (str): Characters in the atlas, anything else is rendered through the text cache.
+        """
+        self.font_path = font_path
+        self.size = size
+        self.color = color
+        self.glyphs = {character: get_font(font_path, size).render(character, True, color) for character in characters}
+        digit_widths = [glyph.get_width() for character, glyph in self.glyphs.items() if character.isdigit()]
+        self.digit_width = max(digit_widths) if digit_widths else 0
+        self.height = max(glyph.get_height() for glyph in self.glyphs.values())
+
+    def _advance(self, character, glyph):
+        return self.digit_width if character.isdigit() else glyph.get_width()
+
+    def _glyph(self, character):
+        glyph = self.glyphs.get(character)
+        if glyph is None:
+            glyph = text_cache.render(self.font_path, self.size, character, self.color)
+        return glyph
+
+    def width(self, text):
+        return sum(self._advance(character, self._glyph(character)) for character in text)
+
+    def get_rect(self, text, **position):
+        """Returns the rect the text would take up, positioned like Surface.get_rect (ex: topright=(990, 100))."""
+        rect = pygame.Rect(0, 0, self.width(text), self.height)
+        for attribute, value in position.items():
+            setattr(rect, attribute, value)
+        return rect
+
+    def draw(self, surface, text, **position):
+        """
+        Blits a string glyph by glyph.
+
+        Args:
+            surface (pygame.Surface): Surface to draw on.
+            text (str): Text to draw.
+            position: Where to put it, same keywords as Surface.get_rect (ex: topright=(990, 100)).
+        """
+        rect = self.get_rect(text, **position)
+        x = rect.x
+
+        for character in text:
+            glyph = self._glyph(character)
+            advance = self._advance(character, glyph)
+            # Digits are centered in their fixed-width cell
+            surface.blit(glyph, (x + (advance - glyph.get_width()) // 2, rect.y))
+            x += advance
+
+        return rect
+
+_digit_atlases = {}
+
+def get_digit_atlas(font_path, size, color):
+    """Returns the shared DigitAtlas for a font, size and color."""
+    atlas = _digit_atlases.get((font_path, size, color))
+    if atlas is None:
+        atlas = DigitAtlas(font_path, size, color)
+        _digit_atlases[(font_path, size, color)] = atlas
+    return atlas
+
+# Text cache shared by the whole game
+text_cache = TextCache()
+
+def render_text(font_path, size, text, color, antialias=True):
+    """Shortcut for text_cache.render."""
+    return text_cache.render(font_path, size, text, color, antialias)